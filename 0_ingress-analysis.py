@@ -2,16 +2,23 @@
 
 import csv
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import tkinter as tk
 from pathlib import Path
 from tkinter import ttk
 import re
+import numpy as np
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 
 
 BASE_DIR = Path(__file__).resolve().parent
+# Day, ISO week, month and quarter labels as built by build_fleet_counts.
+_PERIOD_LABEL_RE = re.compile(
+    r"^(?:(\d{4})-(\d{2})-(\d{2})|(\d{4})-W(\d{2})|(\d{4})-(\d{2})|(\d{4})-Q(\d))$"
+)
 
 
 def list_csv_files() -> list[str]:
@@ -34,9 +41,7 @@ def load_csv_file(
 
     try:
         headers: list[str] = []
-        preview_rows: list[list[str]] = []
         all_rows: list[list[str]] = []
-        data_rows = 0
         corrupted_rows = 0
         with csv_path.open(newline="") as handle:
             reader = csv.reader(handle)
@@ -45,18 +50,17 @@ def load_csv_file(
             except StopIteration:
                 return False, f"'{filename}' is empty", [], [], []
 
+            # Rows whose width doesn't match the header count as corrupted.
+            width = len(headers)
+            append = all_rows.append
             for row in reader:
-                try:
-                    if len(row) != len(headers):
-                        raise ValueError("column count mismatch")
-                    data_rows += 1
-                    all_rows.append(row)
-                    if len(preview_rows) < preview_limit:
-                        preview_rows.append(row)
-                except Exception:
+                if len(row) == width:
+                    append(row)
+                else:
                     corrupted_rows += 1
-                    continue
 
+        data_rows = len(all_rows)
+        preview_rows = all_rows[:preview_limit]
         total_rows = data_rows + corrupted_rows
         message = f"Total {total_rows}, Success {data_rows}, Fail {corrupted_rows}"
         return True, message, headers, preview_rows, all_rows
@@ -64,6 +68,37 @@ def load_csv_file(
         return False, f"Failed to load '{filename}': {exc}", [], [], []
 
 
+@lru_cache(maxsize=None)
+def parse_period_label(label_txt: str) -> datetime | None:
+    """Parse day/week/month/quarter labels into a representative date (start of period)."""
+    m = _PERIOD_LABEL_RE.match(label_txt)
+    if not m:
+        return None
+    day_y, day_m, day_d, week_y, week, month_y, month, quarter_y, quarter = m.groups()
+    try:
+        if day_y:
+            return datetime(int(day_y), int(day_m), int(day_d))
+        if week_y:
+            return datetime.fromisocalendar(int(week_y), int(week), 1)
+        if month_y:
+            return datetime(int(month_y), int(month), 1)
+        return datetime(int(quarter_y), (int(quarter) - 1) * 3 + 1, 1)
+    except ValueError:
+        return None
+
+
+def _linear_regression(xs: list[float], ys: list[float]) -> tuple[float, float] | None:
+    """Least-squares slope and intercept, or None when the fit is undefined."""
+    if len(xs) < 2:
+        return None
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    if np.ptp(x) == 0:
+        return None
+    slope, intercept = np.polyfit(x, y, 1)
+    return float(slope), float(intercept)
+
+
 def build_ui() -> None:
     root = tk.Tk()
     root.title("Ingress CSV Loader")
@@ -73,6 +108,11 @@ def build_ui() -> None:
     selected_file = tk.StringVar()
     current_headers: list[str] = []
     current_rows: list[list[str]] = []
+    # Columns of current_rows as lists, by column index; built on first use
+    # and dropped on load. Single-column scans read these instead of rows.
+    current_cols: dict[int, list[str]] = {}
+    # Columns as numpy arrays, keyed by (kind, column index); dropped on load.
+    current_arrays: dict[tuple[str, int], np.ndarray] = {}
     pivot_row_field = tk.StringVar()
     pivot_col_field = tk.StringVar()
     fleet_period_var = tk.StringVar(value="all")
@@ -114,6 +154,8 @@ def build_ui() -> None:
             current_headers.extend(headers)
             current_rows.clear()
             current_rows.extend(all_rows)
+            current_cols.clear()
+            current_arrays.clear()
             refresh_vehicle_filter_options()
             load_info_var.set(message)
             populate_table(headers, preview_rows)
@@ -529,68 +571,58 @@ def build_ui() -> None:
         ])
         draw_bar_chart()
 
-    def parse_period_label(label_txt: str) -> datetime | None:
-        """Parse day/week/month/quarter labels into a representative date (start of period)."""
-        try:
-            return datetime.strptime(label_txt, "%Y-%m-%d")
-        except ValueError:
-            pass
-        m = re.match(r"^(\d{4})-W(\d{2})$", label_txt)
-        if m:
-            year, week = int(m.group(1)), int(m.group(2))
-            try:
-                return datetime.strptime(f"{year}-W{week}-1", "%G-W%V-%u")
-            except ValueError:
-                return None
-        try:
-            return datetime.strptime(label_txt, "%Y-%m")
-        except ValueError:
-            pass
-        m = re.match(r"^(\d{4})-Q(\d)$", label_txt)
-        if m:
-            year, quarter = int(m.group(1)), int(m.group(2))
-            month = (quarter - 1) * 3 + 1
-            try:
-                return datetime(year, month, 1)
-            except ValueError:
-                return None
-        return None
-
     def sort_periods(periods: list[str], counts: list[int]) -> tuple[list[str], list[int]]:
         """Sort period labels chronologically when possible, preserving alignment with counts."""
-        combined = list(zip(periods, counts))
-        def sort_key(label: str) -> tuple[int, int]:
-            dt = parse_period_label(label)
-            if dt:
-                return (0, dt.toordinal())
-            return (1, 0)
-        combined.sort(key=lambda pair: sort_key(pair[0]))
-        sorted_periods, sorted_counts = zip(*combined) if combined else ([], [])
+        # Key each label once; unparseable labels go last in their original order.
+        keys = [
+            (0, dt.toordinal()) if dt else (1, 0) for dt in map(parse_period_label, periods)
+        ]
+        combined = sorted(zip(keys, periods, counts), key=itemgetter(0))
+        _keys, sorted_periods, sorted_counts = zip(*combined) if combined else ([], [], [])
         return list(sorted_periods), list(sorted_counts)
 
     def sort_period_labels(periods: list[str]) -> list[str]:
         sorted_periods, _ = sort_periods(periods, [0] * len(periods))
         return sorted_periods
 
+    def column_values(idx: int) -> list[str]:
+        """Every value of one column of current_rows, in row order."""
+        column = current_cols.get(idx)
+        if column is None:
+            column = current_cols[idx] = list(map(itemgetter(idx), current_rows))
+        return column
+
+    def column_array(idx: int) -> np.ndarray:
+        array = current_arrays.get(("value", idx))
+        if array is None:
+            array = current_arrays[("value", idx)] = np.array(column_values(idx), dtype=str)
+        return array
+
+    def date_array(idx: int) -> np.ndarray:
+        """A column run through parse_date as datetime64[D]; NaT where unparseable."""
+        array = current_arrays.get(("date", idx))
+        if array is None:
+            # Parse each distinct cell once; numpy reads the ISO strings and "NaT".
+            iso_dates: dict[str, str] = {}
+            for value in dict.fromkeys(column_values(idx)):
+                dt = parse_date(value)
+                iso_dates[value] = dt.strftime("%Y-%m-%d") if dt else "NaT"
+            array = current_arrays[("date", idx)] = np.array(
+                list(map(iso_dates.__getitem__, column_values(idx))), dtype="datetime64[D]"
+            )
+        return array
+
     def compute_alert_date_range(alert_name: str) -> tuple[str, str] | None:
         """Return min/max dates for a given alert based on the Date column."""
         date_idx = find_header_index("Date")
         alert_idx = find_header_index("RFDS Alert")
         if date_idx is None or alert_idx is None:
             return None
-        min_dt: datetime | None = None
-        max_dt: datetime | None = None
-        for row in current_rows:
-            if alert_idx < len(row) and row[alert_idx] == alert_name:
-                dt = parse_date(row[date_idx]) if date_idx < len(row) else None
-                if dt:
-                    if min_dt is None or dt < min_dt:
-                        min_dt = dt
-                    if max_dt is None or dt > max_dt:
-                        max_dt = dt
-        if min_dt and max_dt:
-            return min_dt.strftime("%Y-%m-%d"), max_dt.strftime("%Y-%m-%d")
-        return None
+        dates = date_array(date_idx)[column_array(alert_idx) == alert_name]
+        dates = dates[~np.isnat(dates)]
+        if not dates.size:
+            return None
+        return str(dates.min()), str(dates.max())
 
     def show_alert_popup(label: str, periods: list[str], counts: list[int], period_kind: str) -> None:
         nonlocal alert_popup
@@ -608,11 +640,12 @@ def build_ui() -> None:
         container.pack(fill="both", expand=True)
         ttk.Label(container, text=f"Alert: {label}").pack(anchor="w")
         # Date range display
-        parsed_dates = [parse_period_label(p) for p in periods if parse_period_label(p)]
+        parsed_dates: list[datetime | None] = [parse_period_label(p) for p in periods]
+        known_dates = [dt for dt in parsed_dates if dt]
         range_text: str | None = None
-        if parsed_dates:
-            start = min(parsed_dates).strftime("%Y-%m-%d")
-            end = max(parsed_dates).strftime("%Y-%m-%d")
+        if known_dates:
+            start = min(known_dates).strftime("%Y-%m-%d")
+            end = max(known_dates).strftime("%Y-%m-%d")
             range_text = f"Date range: {start} to {end}"
         else:
             computed_range = compute_alert_date_range(label)
@@ -630,22 +663,6 @@ def build_ui() -> None:
         ax = fig.add_subplot(111)
         fig_canvas: FigureCanvasTkAgg | None = None
 
-        def linear_regression(xs: list[float], ys: list[float]) -> tuple[float, float] | None:
-            if len(xs) < 2:
-                return None
-            n = len(xs)
-            sum_x = sum(xs)
-            sum_y = sum(ys)
-            sum_xx = sum(x * x for x in xs)
-            sum_xy = sum(x * y for x, y in zip(xs, ys))
-            denom = (n * sum_xx - sum_x * sum_x)
-            if denom == 0:
-                return None
-            slope = (n * sum_xy - sum_x * sum_y) / denom
-            intercept = (sum_y - slope * sum_x) / n
-            return slope, intercept
-
-        parsed_dates: list[datetime | None] = [parse_period_label(p) for p in periods]
         all_parsed = period_kind != "apm" and all(d is not None for d in parsed_dates)
 
         if all_parsed and parsed_dates:
@@ -675,7 +692,7 @@ def build_ui() -> None:
             ax.set_xlabel("APM" if period_kind == "apm" else "Period")
 
         if period_kind != "apm":
-            lr = linear_regression(x_vals, counts)
+            lr = _linear_regression(x_vals, counts)
             if lr:
                 slope, intercept = lr
                 x_min, x_max = min(x_vals), max(x_vals)
@@ -868,13 +885,7 @@ def build_ui() -> None:
             ttk.Label(vehicle_list_inner, text="No Vehicle ID column found").pack(anchor="w")
             return
 
-        ids_seen: list[str] = []
-        for row in current_rows:
-            vehicle_raw = row[vehicle_idx] if vehicle_idx < len(row) else ""
-            if not vehicle_raw:
-                continue
-            if vehicle_raw not in ids_seen:
-                ids_seen.append(vehicle_raw)
+        ids_seen = [vid for vid in dict.fromkeys(column_values(vehicle_idx)) if vid]
 
         filtered_ids = [
             vid for vid in ids_seen if (not filter_text or filter_text in vid.lower())
@@ -1030,29 +1041,7 @@ def build_ui() -> None:
             )
 
         if fleet_period_var.get() in {"day", "week", "month", "quarter"}:
-            parsed_dates: list[datetime | None] = []
-            for period in period_order:
-                dt: datetime | None = None
-                try:
-                    if fleet_period_var.get() == "day":
-                        dt = datetime.strptime(period, "%Y-%m-%d")
-                    elif fleet_period_var.get() == "week":
-                        m = re.match(r"^(\d{4})-W(\d{2})$", period)
-                        if m:
-                            year, week = int(m.group(1)), int(m.group(2))
-                            dt = datetime.strptime(f"{year}-W{week}-1", "%G-W%V-%u")
-                    elif fleet_period_var.get() == "month":
-                        dt = datetime.strptime(period, "%Y-%m")
-                    elif fleet_period_var.get() == "quarter":
-                        m = re.match(r"^(\d{4})-Q(\d)$", period)
-                        if m:
-                            year, quarter = int(m.group(1)), int(m.group(2))
-                            month = (quarter - 1) * 3 + 1
-                            dt = datetime(year, month, 1)
-                except ValueError:
-                    dt = None
-                parsed_dates.append(dt)
-            add_meta_rows_from_dates(parsed_dates)
+            add_meta_rows_from_dates([parse_period_label(period) for period in period_order])
 
         for alert_val in alert_order:
             counts_for_alert = alert_totals.get(alert_val, {})
@@ -1070,9 +1059,7 @@ def build_ui() -> None:
             # Keep consistent vehicle order based on data appearance
             vehicle_order: list[str] = []
             apm_counts: dict[str, dict[str, int]] = {}
-            for row in current_rows:
-                alert_val = row[alert_idx] if alert_idx < len(row) else ""
-                vehicle_raw = row[vehicle_idx] if vehicle_idx < len(row) else ""
+            for alert_val, vehicle_raw in zip(column_values(alert_idx), column_values(vehicle_idx)):
                 vehicle_val = re.sub(r"\\D", "", vehicle_raw)[-4:] if vehicle_raw else ""
                 if vehicle_val not in vehicle_order:
                     vehicle_order.append(vehicle_val)
@@ -1121,9 +1108,7 @@ def build_ui() -> None:
             if value not in collection:
                 collection.append(value)
 
-        for row in current_rows:
-            row_val = row[row_idx] if row_idx < len(row) else ""
-            col_val = row[col_idx] if col_idx < len(row) else ""
+        for row_val, col_val in zip(column_values(row_idx), column_values(col_idx)):
             remember(row_val, row_order)
             remember(col_val, col_order)
             counts.setdefault(row_val, {})
@@ -1,20 +1,45 @@
 #!/usr/bin/env python3
 
 import csv
+import heapq
 import json
+from collections import Counter
+from collections.abc import Callable, Sequence
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 import time
 import tkinter as tk
 from pathlib import Path
+import queue
+from statistics import fmean
+import threading
 from tkinter import ttk
 import re
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
+import numpy as np
 
 
 BASE_DIR = Path(__file__).resolve().parent
 FILTER_STATE_PATH = BASE_DIR / "mwo_filter_state.json"
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+_NON_DIGIT_RE = re.compile(r"\D+")
+_DIGIT_RE = re.compile(r"\d")
+# Day, ISO week, month and quarter labels as produced by _PERIOD_FORMATTERS,
+# plus the "Sum" column of the "all" view.
+_PERIOD_LABEL_RE = re.compile(
+    r"^(?:(\d{4})-(\d{2})-(\d{2})|(\d{4})-W(\d{2})|(\d{4})-(\d{2})|(\d{4})-Q([1-4])|Sum)$"
+)
+_DATE_FORMATS = (
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y %H:%M",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %I:%M:%S %p",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+)
 
 
 def list_csv_files() -> list[str]:
@@ -24,7 +49,7 @@ def list_csv_files() -> list[str]:
 
 def load_csv_file(
     filename: str, preview_limit: int = 200
-) -> tuple[bool, str, list[str], list[list[str]], list[list[str]]]:
+) -> tuple[bool, str, list[str], list[tuple[str, ...]], list[tuple[str, ...]]]:
     """
     Attempt to load the given CSV.
 
@@ -36,10 +61,12 @@ def load_csv_file(
         return False, f"File not found: {filename}", [], [], []
 
     try:
-        def read_csv(encoding: str) -> tuple[list[str], list[list[str]], list[list[str]], int, int]:
+        def read_csv(
+            encoding: str,
+        ) -> tuple[list[str], list[tuple[str, ...]], list[tuple[str, ...]], int, int]:
             headers: list[str] = []
-            preview_rows: list[list[str]] = []
-            all_rows: list[list[str]] = []
+            preview_rows: list[tuple[str, ...]] = []
+            all_rows: list[tuple[str, ...]] = []
             data_rows = 0
             corrupted_rows = 0
             with csv_path.open(newline="", encoding=encoding) as handle:
@@ -54,6 +81,9 @@ def load_csv_file(
                         if len(row) != len(headers):
                             raise ValueError("column count mismatch")
                         data_rows += 1
+                        # Rows are read-only from here on; tuples are smaller
+                        # and cheaper to index than the lists csv hands out.
+                        row = tuple(row)
                         all_rows.append(row)
                         if len(preview_rows) < preview_limit:
                             preview_rows.append(row)
@@ -116,6 +146,262 @@ def save_filter_state(
         json.dump(payload, handle, indent=2)
 
 
+@lru_cache(maxsize=None)
+def parse_date(value: str) -> datetime | None:
+    """Parse common date formats; return None if invalid."""
+    if not value:
+        return None
+    value = value.strip()
+    # Fast paths for zero-padded ISO and MM/DD/YYYY values: slice the fixed-width
+    # fields directly; anything else (or an invalid date) falls through to strptime.
+    if len(value) >= 10 and value[4] == "-" and value[7] == "-":
+        try:
+            if len(value) == 10:
+                return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+            if (
+                len(value) == 19
+                and value[10] in " T"
+                and value[13] == ":"
+                and value[16] == ":"
+            ):
+                return datetime(
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+        except ValueError:
+            pass
+    elif len(value) == 10 and value[2] == "/" and value[5] == "/":
+        try:
+            return datetime(int(value[6:10]), int(value[0:2]), int(value[3:5]))
+        except ValueError:
+            pass
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@lru_cache(maxsize=None)
+def parse_period_label(label_txt: str) -> datetime | None:
+    """Parse day/week/month/quarter labels into a representative date (start of period)."""
+    m = _PERIOD_LABEL_RE.match(label_txt)
+    if not m:
+        return None
+    day_y, day_m, day_d, week_y, week, month_y, month, quarter_y, quarter = m.groups()
+    try:
+        if day_y:
+            return datetime(int(day_y), int(day_m), int(day_d))
+        if week_y:
+            return datetime.fromisocalendar(int(week_y), int(week), 1)
+        if month_y:
+            return datetime(int(month_y), int(month), 1)
+        if quarter_y:
+            return datetime(int(quarter_y), (int(quarter) - 1) * 3 + 1, 1)
+    except ValueError:
+        return None
+    return None
+
+
+def _format_week(dt: datetime) -> str:
+    iso_year, iso_week, _ = dt.isocalendar()
+    return f"{iso_year}-W{iso_week:02d}"
+
+
+_PERIOD_FORMATTERS = {
+    "day": lambda dt: dt.strftime("%Y-%m-%d"),
+    "week": _format_week,
+    "month": lambda dt: dt.strftime("%Y-%m"),
+    "quarter": lambda dt: f"{dt.year}-Q{(dt.month - 1) // 3 + 1}",
+}
+
+
+@lru_cache(maxsize=None)
+def period_labels_for(date_val: str) -> dict[str, str] | None:
+    """Format a raw date cell into every period label at once, or None if unparseable."""
+    dt = parse_date(date_val)
+    if not dt:
+        return None
+    # Period labels only depend on the calendar day, so timestamps that start
+    # with a fixed-width date share the labels cached for that day.
+    value = date_val.strip()
+    if len(value) > 10 and value[10] in " T" and (
+        (value[4] == "-" and value[7] == "-") or (value[2] == "/" and value[5] == "/")
+    ):
+        return period_labels_for(value[:10])
+    return {kind: formatter(dt) for kind, formatter in _PERIOD_FORMATTERS.items()}
+
+
+def period_key_for(date_val: str, period_kind: str) -> str | None:
+    """Return the period bucket label for a raw date cell, or None if unparseable."""
+    if period_kind not in _PERIOD_FORMATTERS:
+        return "Sum"
+    labels = period_labels_for(date_val)
+    return labels[period_kind] if labels else None
+
+
+_PERIOD_META_LABELS = ("YEAR", "MONTH", "DAY", "WEEK", "QUARTER")
+_PERIOD_META_LABEL_SET = frozenset(_PERIOD_META_LABELS)
+
+
+@lru_cache(maxsize=None)
+def period_meta_cells(label_txt: str) -> tuple[str, str, str, str, str]:
+    """YEAR/MONTH/DAY/WEEK/QUARTER cells for the start date of a period label."""
+    dt = parse_period_label(label_txt)
+    if dt is None:
+        return ("", "", "", "", "")
+    _, iso_week, _ = dt.isocalendar()
+    return (
+        str(dt.year),
+        f"{dt.month:02d}",
+        f"{dt.day:02d}",
+        f"{iso_week:02d}",
+        str((dt.month - 1) // 3 + 1),
+    )
+
+
+def period_meta_rows(period_order: list[str]) -> list[list[str]]:
+    """Date meta rows (one per _PERIOD_META_LABELS entry) for a period header."""
+    columns = zip(*map(period_meta_cells, period_order))
+    return [[name, *cells] for name, cells in zip(_PERIOD_META_LABELS, columns)]
+
+
+# Chart bucket classifiers. Cells repeat a handful of spellings, so results are
+# memoized across redraws until the next load.
+@lru_cache(maxsize=None)
+def normalize_hw_sw(value: str) -> str:
+    val = (value or "").strip().lower()
+    if "hard" in val:
+        return "Hardware"
+    if "soft" in val:
+        return "Software"
+    return "Other"
+
+
+@lru_cache(maxsize=None)
+def normalize_work_type(value: str) -> str:
+    val = (value or "").strip().lower()
+    if "cmt" in val:
+        return "CMT"
+    if "pm" in val:
+        return "PM"
+    if "upgrade" in val:
+        return "Upgrade"
+    if "internal" in val:
+        return "Internal testing"
+    if "inspect" in val:
+        return "Inspection"
+    return "Other"
+
+
+@lru_cache(maxsize=None)
+def normalize_icr(value: str) -> str:
+    val = (value or "").strip().lower()
+    if "inspect" in val:
+        return "Inspection"
+    if "change" in val:
+        return "Change"
+    if "rework" in val:
+        return "Rework"
+    return "Other"
+
+
+@lru_cache(maxsize=None)
+def normalize_accident(value: str) -> str:
+    acc_val = value.strip().lower() if isinstance(value, str) else str(value).lower()
+    return "Yes" if acc_val in {"yes", "y", "true", "1"} else "No"
+
+
+def clear_parse_caches() -> None:
+    """Drop memoized date/period parses and cell classifications, e.g. before a new CSV is loaded."""
+    parse_date.cache_clear()
+    parse_period_label.cache_clear()
+    period_labels_for.cache_clear()
+    period_meta_cells.cache_clear()
+    normalize_hw_sw.cache_clear()
+    normalize_work_type.cache_clear()
+    normalize_icr.cache_clear()
+    normalize_accident.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(tokens: tuple[str, ...]) -> re.Pattern[str]:
+    """Alternation regex matching any of the lowered tokens as a substring."""
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
+def _linear_regression(xs: list[float], ys: list[float]) -> tuple[float, float] | None:
+    """Least-squares slope and intercept, or None when the fit is undefined."""
+    if len(xs) < 2:
+        return None
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+    if np.ptp(x) == 0:
+        return None
+    slope, intercept = np.polyfit(x, y, 1)
+    return float(slope), float(intercept)
+
+
+def _pivot_count_matrix(
+    pairs: list[tuple[str, str]], row_order: list[str], col_order: list[str]
+) -> np.ndarray:
+    """Count (row, column) pairs into a dense int matrix laid out by the given orders."""
+    row_pos = {name: idx for idx, name in enumerate(row_order)}
+    col_pos = {name: idx for idx, name in enumerate(col_order)}
+    n_cols = len(col_order)
+    flat = np.fromiter(
+        (row_pos[row_name] * n_cols + col_pos[col_name] for row_name, col_name in pairs),
+        dtype=np.intp,
+        count=len(pairs),
+    )
+    counts = np.bincount(flat, minlength=len(row_order) * n_cols)
+    return counts.reshape(len(row_order), n_cols)
+
+
+def _insert_rows(tree: ttk.Treeview, rows: Sequence[Sequence[str]], width: int) -> None:
+    """Append rows to a Treeview, padded or cut to width, with one Tcl call per row.
+
+    Skips Treeview.insert's keyword formatting and string joining; the values
+    tuple is handed to Tcl as a list object directly.
+    """
+    call = tree.tk.call
+    widget = tree._w
+    for row in rows:
+        if len(row) == width:
+            values = tuple(row)
+        else:
+            values = tuple(row[:width]) + ("",) * (width - len(row))
+        call(widget, "insert", "", "end", "-values", values)
+
+
+def _insert_tracked_rows(
+    tree: ttk.Treeview, rows: Sequence[Sequence[str]], width: int, meta_labels: frozenset[str]
+) -> dict[str, list[str]]:
+    """Like _insert_rows, tagging rows labelled in meta_labels as "meta".
+
+    Returns the inserted values keyed by item id, in display order.
+    """
+    call = tree.tk.call
+    widget = tree._w
+    inserted: dict[str, list[str]] = {}
+    for row in rows:
+        if len(row) == width:
+            values = list(row)
+        else:
+            values = list(row[:width]) + [""] * (width - len(row))
+        if values and values[0] in meta_labels:
+            item_id = call(widget, "insert", "", "end", "-values", tuple(values), "-tags", "meta")
+        else:
+            item_id = call(widget, "insert", "", "end", "-values", tuple(values))
+        inserted[item_id] = values
+    return inserted
+
+
 def build_ui() -> None:
     root = tk.Tk()
     root.title("MWO CSV Loader")
@@ -124,7 +410,27 @@ def build_ui() -> None:
     status_var = tk.StringVar(value="Select a CSV and click Load")
     selected_file = tk.StringVar()
     current_headers: list[str] = []
-    current_rows: list[list[str]] = []
+    header_index_map: dict[str, int] = {}
+    # Lowercased cell text per column for keyword search, aligned with
+    # current_rows; rebuilt on load.
+    lower_cell_cache: dict[int, list[str]] = {}
+    # Filter columns of current_rows as numpy arrays of category codes (plus
+    # the accident flags), keyed by (kind, column index); rebuilt on load.
+    filter_column_cache: dict[tuple[str, int], np.ndarray] = {}
+    # Cell value -> category code for each coded filter column.
+    filter_category_codes: dict[int, dict[str, int]] = {}
+    # Last filter result, as (current_rows indexes, rows), keyed by
+    # filter_signature(); callers only read the shared lists. Cleared on load.
+    filtered_rows_cache: dict[tuple, tuple[list[int], list[tuple[str, ...]]]] = {}
+    # Start time period label per row of current_rows, by period kind; None for
+    # unparseable dates. Built on first use after a load.
+    period_key_columns: dict[str, list[str | None]] = {}
+    # The same, integer-coded: (labels, code per row with -1 for invalid dates).
+    period_code_columns: dict[str, tuple[list[str], np.ndarray]] = {}
+    current_rows: list[tuple[str, ...]] = []
+    row_index_cache: dict[tuple, list[tuple[str, str, str | None]]] = {}
+    # Popup model aggregates (periods, models, counts matrix); cleared on load.
+    model_counts_cache: dict[tuple, tuple[list[str], list[str], np.ndarray]] = {}
     pivot_row_field = tk.StringVar()
     pivot_col_field = tk.StringVar()
     fleet_period_var = tk.StringVar(value="all")
@@ -141,6 +447,12 @@ def build_ui() -> None:
     keyword_fleet_chart_var = tk.BooleanVar(value=True)
     keyword_vehicle_chart_var = tk.BooleanVar(value=False)
     keyword_sort_state = {"column": "", "reverse": False}
+    keyword_col_index: dict[str, int] = {}
+    # Python-side copy of the values each summary table row was populated with,
+    # keyed by widget path then item id, so readers skip a Tcl item() per row.
+    table_row_values: dict[str, dict[str, list[str]]] = {}
+    # Period count cells of those rows as int arrays, filled on first selection.
+    table_row_counts: dict[str, dict[str, np.ndarray]] = {}
     keyword_model_filter_var = tk.StringVar(value="")
     keyword_component_filter_var = tk.StringVar(value="")
     total_count_var = tk.BooleanVar(value=True)
@@ -158,6 +470,13 @@ def build_ui() -> None:
     selected_work_type_vars: dict[str, tk.BooleanVar] = {}
     selected_hw_sw_vars: dict[str, tk.BooleanVar] = {}
     selected_icr_vars: dict[str, tk.BooleanVar] = {}
+    # Checked values of each filter, mirrored from the BooleanVars above by a
+    # write trace so readers don't cross into Tcl once per option.
+    checked_apm_ids: set[str] = set()
+    checked_trailer_ids: set[str] = set()
+    checked_work_types: set[str] = set()
+    checked_hw_sw: set[str] = set()
+    checked_icr: set[str] = set()
     saved_filter_state, saved_window_size, saved_component_sash = load_filter_state()
     saved_filters_applied = False
     alert_popup: tk.Toplevel | None = None
@@ -165,6 +484,28 @@ def build_ui() -> None:
     accident_yes_var = tk.BooleanVar(value=False)
     accident_no_var = tk.BooleanVar(value=False)
     accident_all_var = tk.BooleanVar(value=True)
+    # Bumped whenever any filter selection changes; filter_signature() is only
+    # recomputed when it moves.
+    filter_version = 0
+    filter_signature_cache: dict[int, tuple] = {}
+    # Filter option checkbuttons per list frame, reconfigured on each rebuild
+    # instead of being destroyed and recreated.
+    filter_checkbutton_pool: dict[str, list[ttk.Checkbutton]] = {}
+    # What each pooled checkbutton currently shows, as (text, variable, row,
+    # column), or None while hidden; lets a rebuild touch only changed slots.
+    filter_slot_shown: dict[str, list[tuple[str, str, int, int] | None]] = {}
+    # "No ... column found" label per list frame, while one is shown.
+    filter_frame_notes: dict[str, ttk.Label] = {}
+    # Write-trace callback name per filter option BooleanVar (by Tcl name), so
+    # a dropped option's trace can be removed along with it.
+    filter_var_traces: dict[str, str] = {}
+
+    def bump_filter_version(*_args) -> None:
+        nonlocal filter_version
+        filter_version += 1
+
+    for accident_var in (accident_yes_var, accident_no_var, accident_all_var):
+        accident_var.trace_add("write", bump_filter_version)
 
     if saved_window_size:
         try:
@@ -199,10 +540,24 @@ def build_ui() -> None:
             return
         success, message, headers, preview_rows, all_rows = load_csv_file(filename)
         status_var.set(message)
-        status_label.configure(foreground="green" if success else "red")
+        set_status_color("green" if success else "red")
         if success:
+            clear_parse_caches()
+            row_index_cache.clear()
+            model_counts_cache.clear()
+            lower_cell_cache.clear()
+            filter_column_cache.clear()
+            filter_category_codes.clear()
+            filtered_rows_cache.clear()
+            period_key_columns.clear()
+            period_code_columns.clear()
+            chart_draw_keys.clear()
+            table_build_keys.clear()
             current_headers.clear()
             current_headers.extend(headers)
+            header_index_map.clear()
+            for idx, name in enumerate(headers):
+                header_index_map.setdefault(name.strip().lower(), idx)
             current_rows.clear()
             current_rows.extend(all_rows)
             refresh_apm_filter_options()
@@ -225,6 +580,8 @@ def build_ui() -> None:
             clear_model_table()
             clear_apm_table()
             clear_keyword_table()
+            chart_draw_keys.clear()
+            table_build_keys.clear()
             load_info_var.set("")
 
     def bind_double_q_close(
@@ -240,7 +597,7 @@ def build_ui() -> None:
             last_q_time["time"] = now
             if message:
                 status_var.set(message)
-                status_label.configure(foreground="orange")
+                set_status_color("orange")
 
         window.bind("q", handler)
 
@@ -278,6 +635,14 @@ def build_ui() -> None:
 
     status_label = ttk.Label(main_frame, textvariable=status_var, foreground="gray")
     status_label.pack(anchor="w")
+    status_color = "gray"
+
+    def set_status_color(color: str) -> None:
+        """Recolor the status line, skipping the Tk call when the color is unchanged."""
+        nonlocal status_color
+        if color != status_color:
+            status_label.configure(foreground=color)
+            status_color = color
 
     notebook = ttk.Notebook(main_frame)
     notebook.pack(fill="both", expand=True, pady=(8, 0))
@@ -311,7 +676,7 @@ def build_ui() -> None:
 
     def compute_column_widths(
         headers: list[str],
-        rows: list[list[str]],
+        rows: Sequence[Sequence[str]],
         min_width: int = 10,
         max_width: int = 260,
     ) -> list[int]:
@@ -325,16 +690,14 @@ def build_ui() -> None:
             max(min_width, min(max_width, length * 8)) for length in longest
         ]  # ~8px per character
 
-    def populate_table(headers: list[str], rows: list[list[str]]) -> None:
+    def populate_table(headers: list[str], rows: list[tuple[str, ...]]) -> None:
         clear_table()
         table.configure(columns=headers)
         widths = compute_column_widths(headers, rows)
         for idx, name in enumerate(headers):
             table.heading(name, text=name)
             table.column(name, width=widths[idx], anchor="w")
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            table.insert("", "end", values=values[: len(headers)])
+        _insert_rows(table, rows, len(headers))
 
     pivot_controls = ttk.LabelFrame(main_frame, text="Pivot table (counts)")
     pivot_controls.pack(in_=pivot_tab, fill="x", pady=(0, 8))
@@ -564,13 +927,11 @@ def build_ui() -> None:
     width_controls.pack(fill="x", padx=4, pady=(0, 6))
     ttk.Label(width_controls, text="Component col width:").pack(side="left")
     alert_width_entry = ttk.Entry(width_controls, textvariable=alert_col_width_var, width=8)
-    alert_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(width_controls, textvariable=alert_col_width_var).pack(side="left", padx=(0, 10))
+    alert_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Label(width_controls, text="Day col width:").pack(side="left")
     day_width_entry = ttk.Entry(width_controls, textvariable=day_col_width_var, width=8)
-    day_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(width_controls, textvariable=day_col_width_var).pack(side="left", padx=(0, 10))
+    day_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Button(width_controls, text="Apply widths", command=lambda: apply_width_settings()).pack(
         side="left", padx=(10, 0)
@@ -592,10 +953,10 @@ def build_ui() -> None:
         fleet_table_frame, orient="horizontal", command=fleet_table.xview
     )
     fleet_table.configure(yscrollcommand=fleet_y_scroll.set, xscrollcommand=fleet_x_scroll.set)
+    fleet_table.tag_configure("meta", background="#e6e6e6")
     fleet_table.pack(side="top", fill="both", expand=True)
     fleet_y_scroll.pack(side="right", fill="y")
     fleet_x_scroll.pack(side="bottom", fill="x")
-    fleet_table.bind("<<TreeviewSelect>>", lambda e: None)
 
 
     chart_period_row = ttk.Frame(component_right)
@@ -701,13 +1062,11 @@ def build_ui() -> None:
     apm_width_controls.pack(fill="x", padx=4, pady=(0, 6))
     ttk.Label(apm_width_controls, text="Component col width:").pack(side="left")
     apm_alert_width_entry = ttk.Entry(apm_width_controls, textvariable=alert_col_width_var, width=8)
-    apm_alert_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(apm_width_controls, textvariable=alert_col_width_var).pack(side="left", padx=(0, 10))
+    apm_alert_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Label(apm_width_controls, text="APM col width:").pack(side="left")
     apm_day_width_entry = ttk.Entry(apm_width_controls, textvariable=apm_col_width_var, width=8)
-    apm_day_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(apm_width_controls, textvariable=apm_col_width_var).pack(side="left", padx=(0, 10))
+    apm_day_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Button(apm_width_controls, text="Apply widths", command=lambda: apply_apm_width_settings()).pack(
         side="left", padx=(10, 0)
@@ -726,7 +1085,6 @@ def build_ui() -> None:
     apm_table.pack(side="top", fill="both", expand=True)
     apm_y_scroll.pack(side="right", fill="y")
     apm_x_scroll.pack(side="bottom", fill="x")
-    apm_table.bind("<<TreeviewSelect>>", lambda e: None)
 
     # BY KEYWORD tab
     keyword_body = ttk.Panedwindow(keyword_tab, orient="horizontal")
@@ -761,7 +1119,7 @@ def build_ui() -> None:
 
     keyword_workdone_controls = ttk.Frame(keyword_left)
     keyword_workdone_controls.pack(fill="x", padx=4, pady=(0, 4))
-    ttk.Label(keyword_workdone_controls, text="Keyword search (Work done):").pack(
+    ttk.Label(keyword_workdone_controls, text="Keyword search 2 (Work done):").pack(
         side="left"
     )
     keyword_entry_2 = ttk.Entry(
@@ -1085,19 +1443,13 @@ def build_ui() -> None:
     model_alert_width_entry = ttk.Entry(
         model_width_controls, textvariable=alert_col_width_var, width=8
     )
-    model_alert_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(model_width_controls, textvariable=alert_col_width_var).pack(
-        side="left", padx=(0, 10)
-    )
+    model_alert_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Label(model_width_controls, text="Day col width:").pack(side="left")
     model_day_width_entry = ttk.Entry(
         model_width_controls, textvariable=day_col_width_var, width=8
     )
-    model_day_width_entry.pack(side="left", padx=(4, 4))
-    ttk.Label(model_width_controls, textvariable=day_col_width_var).pack(
-        side="left", padx=(0, 10)
-    )
+    model_day_width_entry.pack(side="left", padx=(4, 10))
 
     ttk.Button(
         model_width_controls, text="Apply widths", command=lambda: apply_model_width_settings()
@@ -1119,10 +1471,10 @@ def build_ui() -> None:
         model_table_frame, orient="horizontal", command=model_table.xview
     )
     model_table.configure(yscrollcommand=model_y_scroll.set, xscrollcommand=model_x_scroll.set)
+    model_table.tag_configure("meta", background="#e6e6e6")
     model_table.pack(side="top", fill="both", expand=True)
     model_y_scroll.pack(side="right", fill="y")
     model_x_scroll.pack(side="bottom", fill="x")
-    model_table.bind("<<TreeviewSelect>>", lambda e: None)
 
     model_chart_period_row = ttk.Frame(model_right)
     model_chart_period_row.pack(fill="x", padx=4, pady=(4, 4))
@@ -1170,6 +1522,7 @@ def build_ui() -> None:
     def clear_pivot_table() -> None:
         pivot_table.delete(*pivot_table.get_children())
         pivot_table.configure(columns=[])
+        table_build_keys.pop("pivot", None)
 
     def populate_pivot_table(headers: list[str], rows: list[list[str]]) -> None:
         clear_pivot_table()
@@ -1178,20 +1531,72 @@ def build_ui() -> None:
         for idx, name in enumerate(headers):
             pivot_table.heading(name, text=name)
             pivot_table.column(name, width=widths[idx], anchor="w")
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            pivot_table.insert("", "end", values=values[: len(headers)])
+        _insert_rows(pivot_table, rows, len(headers))
+
+    def table_rows(table: ttk.Treeview) -> list[list[str]]:
+        """Row values of a summary table in display order."""
+        return list(table_row_values.get(str(table), {}).values())
+
+    def row_values(table: ttk.Treeview, row_id: str) -> list:
+        cached = table_row_values.get(str(table), {}).get(row_id)
+        if cached is not None:
+            return cached
+        return list(table.item(row_id).get("values", []))
+
+    def row_counts(table: ttk.Treeview, row_id: str) -> np.ndarray:
+        """Count cells after the label column as int64; non-numeric cells are 0."""
+        cache = table_row_counts.setdefault(str(table), {})
+        counts = cache.get(row_id)
+        if counts is None:
+            cells: list[int] = []
+            for val in row_values(table, row_id)[1:]:
+                try:
+                    cells.append(int(val))
+                except (TypeError, ValueError):
+                    cells.append(0)
+            counts = cache[row_id] = np.array(cells, dtype=np.int64)
+        return counts
+
+    def period_column_counts(
+        table: ttk.Treeview, period_idx: int
+    ) -> tuple[list[str], list[int]]:
+        """Row labels and int counts for one period column, skipping metadata rows."""
+        labels: list[str] = []
+        cells: list[str] = []
+        for row_vals in table_rows(table):
+            if len(row_vals) <= period_idx:
+                continue
+            label = str(row_vals[0])
+            if label in _PERIOD_META_LABEL_SET:
+                continue
+            labels.append(label)
+            cells.append(row_vals[period_idx])
+        try:
+            counts = np.array(cells, dtype=np.int64)
+        except (TypeError, ValueError):
+            counts = np.zeros(len(cells), dtype=np.int64)
+            for idx, val in enumerate(cells):
+                try:
+                    counts[idx] = int(val)
+                except (TypeError, ValueError):
+                    continue
+        return labels, counts.tolist()
 
     def clear_fleet_table() -> None:
         fleet_table.delete(*fleet_table.get_children())
         fleet_table.configure(columns=[])
+        table_row_values.pop(str(fleet_table), None)
+        table_row_counts.pop(str(fleet_table), None)
 
     def clear_apm_table() -> None:
         apm_table.delete(*apm_table.get_children())
         apm_table.configure(columns=[])
+        table_row_values.pop(str(apm_table), None)
+        table_row_counts.pop(str(apm_table), None)
 
     def populate_fleet_table(headers: list[str], rows: list[list[str]]) -> None:
         clear_fleet_table()
+        chart_draw_keys.pop("fleet", None)
         fleet_table.configure(columns=headers)
         try:
             first_width = int(alert_col_width_var.get())
@@ -1204,8 +1609,6 @@ def build_ui() -> None:
             day_width = 25
             day_col_width_var.set(str(day_width))
         default_width = 120
-        meta_labels = {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}
-        fleet_table.tag_configure("meta", background="#e6e6e6")
         for idx, name in enumerate(headers):
             if idx == 0:
                 width = first_width
@@ -1221,18 +1624,20 @@ def build_ui() -> None:
                 anchor="w",
                 stretch=False,  # prevent auto-stretching; keeps horizontal scroll usable
             )
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            label = str(values[0]) if values else ""
-            tags = ("meta",) if label in meta_labels else ()
-            fleet_table.insert("", "end", values=values[: len(headers)], tags=tags)
+        table_row_values[str(fleet_table)] = _insert_tracked_rows(
+            fleet_table, rows, len(headers), _PERIOD_META_LABEL_SET
+        )
 
     def clear_model_table() -> None:
         model_table.delete(*model_table.get_children())
         model_table.configure(columns=[])
+        table_build_keys.pop("model", None)
+        table_row_values.pop(str(model_table), None)
+        table_row_counts.pop(str(model_table), None)
 
     def populate_model_table(headers: list[str], rows: list[list[str]]) -> None:
         clear_model_table()
+        chart_draw_keys.pop("model", None)
         model_table.configure(columns=headers)
         try:
             first_width = int(alert_col_width_var.get())
@@ -1245,8 +1650,6 @@ def build_ui() -> None:
             day_width = 25
             day_col_width_var.set(str(day_width))
         default_width = 120
-        meta_labels = {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}
-        model_table.tag_configure("meta", background="#e6e6e6")
         for idx, name in enumerate(headers):
             if idx == 0:
                 width = first_width
@@ -1262,11 +1665,9 @@ def build_ui() -> None:
                 anchor="w",
                 stretch=False,
             )
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            label = str(values[0]) if values else ""
-            tags = ("meta",) if label in meta_labels else ()
-            model_table.insert("", "end", values=values[: len(headers)], tags=tags)
+        table_row_values[str(model_table)] = _insert_tracked_rows(
+            model_table, rows, len(headers), _PERIOD_META_LABEL_SET
+        )
 
     def populate_apm_table(headers: list[str], rows: list[list[str]]) -> None:
         clear_apm_table()
@@ -1289,25 +1690,25 @@ def build_ui() -> None:
                 width = apm_width or default_width
             apm_table.heading(name, text=name)
             apm_table.column(name, width=width, anchor="w", stretch=False, minwidth=width)
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            apm_table.insert("", "end", values=values[: len(headers)])
+        table_row_values[str(apm_table)] = _insert_tracked_rows(
+            apm_table, rows, len(headers), frozenset()
+        )
 
     def clear_keyword_table() -> None:
         keyword_table.delete(*keyword_table.get_children())
         keyword_table.configure(columns=[])
+        keyword_col_index.clear()
 
     def sort_keyword_table(column: str, force: bool = False) -> None:
+        col_idx = keyword_col_index.get(column)
+        if col_idx is None:
+            return
         rows = [
             (keyword_table.item(item_id)["values"], item_id)
             for item_id in keyword_table.get_children()
         ]
         if not rows:
             return
-        try:
-            col_idx = list(keyword_table["columns"]).index(column)
-        except ValueError:
-            return
 
         def key_func(values: list[str]) -> tuple[int, object]:
             value = values[col_idx] if col_idx < len(values) else ""
@@ -1324,14 +1725,15 @@ def build_ui() -> None:
             reverse = not keyword_sort_state["reverse"]
 
         rows.sort(key=lambda pair: key_func(pair[0]), reverse=reverse)
-        for idx, (_values, item_id) in enumerate(rows):
-            keyword_table.move(item_id, "", idx)
+        # Reorder in one Tcl call instead of a move (and redraw) per row.
+        keyword_table.set_children("", *(item_id for _values, item_id in rows))
         keyword_sort_state["column"] = column
         keyword_sort_state["reverse"] = reverse
 
-    def populate_keyword_table(headers: list[str], rows: list[list[str]]) -> None:
+    def populate_keyword_table(headers: list[str], rows: list[tuple[str, ...]]) -> None:
         clear_keyword_table()
         keyword_table.configure(columns=headers)
+        keyword_col_index.update({name: idx for idx, name in enumerate(headers)})
         widths = compute_column_widths(headers, rows, min_width=60, max_width=220)
         for idx, name in enumerate(headers):
             keyword_table.heading(
@@ -1340,9 +1742,7 @@ def build_ui() -> None:
                 command=lambda col=name: sort_keyword_table(col),
             )
             keyword_table.column(name, width=widths[idx], anchor="w")
-        for row in rows:
-            values = row + [""] * (len(headers) - len(row))
-            keyword_table.insert("", "end", values=values[: len(headers)])
+        _insert_rows(keyword_table, rows, len(headers))
         if headers:
             sort_keyword_table(headers[0], force=True)
 
@@ -1393,67 +1793,96 @@ def build_ui() -> None:
 
     def apply_apm_width_settings() -> None:
         """Re-render APM table with current width settings."""
-        populate_apm_table(
-            list(apm_table["columns"]),
-            [apm_table.item(row_id)["values"] for row_id in apm_table.get_children()],
-        )
+        populate_apm_table(list(apm_table["columns"]), table_rows(apm_table))
 
     def apply_width_settings() -> None:
         """Re-render fleet table with current width settings."""
-        populate_fleet_table(list(fleet_table["columns"]), [
-            fleet_table.item(row_id)["values"] for row_id in fleet_table.get_children()
-        ])
+        populate_fleet_table(list(fleet_table["columns"]), table_rows(fleet_table))
         draw_bar_chart()
 
     def apply_model_width_settings() -> None:
         """Re-render model table with current width settings."""
-        populate_model_table(list(model_table["columns"]), [
-            model_table.item(row_id)["values"] for row_id in model_table.get_children()
-        ])
+        populate_model_table(list(model_table["columns"]), table_rows(model_table))
         draw_model_chart()
-    def parse_period_label(label_txt: str) -> datetime | None:
-        """Parse day/week/month/quarter labels into a representative date (start of period)."""
-        try:
-            return datetime.strptime(label_txt, "%Y-%m-%d")
-        except ValueError:
-            pass
-        m = re.match(r"^(\d{4})-W(\d{2})$", label_txt)
-        if m:
-            year, week = int(m.group(1)), int(m.group(2))
-            try:
-                return datetime.strptime(f"{year}-W{week}-1", "%G-W%V-%u")
-            except ValueError:
-                return None
-        try:
-            return datetime.strptime(label_txt, "%Y-%m")
-        except ValueError:
-            pass
-        m = re.match(r"^(\d{4})-Q(\d)$", label_txt)
-        if m:
-            year, quarter = int(m.group(1)), int(m.group(2))
-            month = (quarter - 1) * 3 + 1
-            try:
-                return datetime(year, month, 1)
-            except ValueError:
-                return None
-        return None
+
+    @lru_cache(maxsize=64)
+    def _sort_periods_cached(
+        periods: tuple[str, ...], counts: tuple[int, ...]
+    ) -> tuple[tuple[str, ...], tuple[int, ...], tuple[datetime | None, ...]]:
+        keyed = [
+            ((0, dt.toordinal()) if dt else (1, 0), period, count, dt)
+            for period, count in zip(periods, counts)
+            for dt in (parse_period_label(period),)
+        ]
+        keyed.sort(key=itemgetter(0))
+        sorted_periods = tuple(period for _key, period, _count, _dt in keyed)
+        sorted_counts = tuple(count for _key, _period, count, _dt in keyed)
+        sorted_dates = tuple(dt for _key, _period, _count, dt in keyed)
+        return sorted_periods, sorted_counts, sorted_dates
 
     def sort_periods(periods: list[str], counts: list[int]) -> tuple[list[str], list[int]]:
         """Sort period labels chronologically when possible, preserving alignment with counts."""
-        combined = list(zip(periods, counts))
-        def sort_key(label: str) -> tuple[int, int]:
-            dt = parse_period_label(label)
-            if dt:
-                return (0, dt.toordinal())
-            return (1, 0)
-        combined.sort(key=lambda pair: sort_key(pair[0]))
-        sorted_periods, sorted_counts = zip(*combined) if combined else ([], [])
+        sorted_periods, sorted_counts, _ = _sort_periods_cached(tuple(periods), tuple(counts))
         return list(sorted_periods), list(sorted_counts)
 
+    def sort_periods_with_dates(
+        periods: list[str], counts: list[int]
+    ) -> tuple[list[str], list[int], list[datetime | None]]:
+        """Like sort_periods, also returning each label's parsed start date (or None)."""
+        sorted_periods, sorted_counts, sorted_dates = _sort_periods_cached(
+            tuple(periods), tuple(counts)
+        )
+        return list(sorted_periods), list(sorted_counts), list(sorted_dates)
+
     def sort_period_labels(periods: list[str]) -> list[str]:
         sorted_periods, _ = sort_periods(periods, [0] * len(periods))
         return sorted_periods
 
+    def build_row_index(
+        label_names: list[str], label_field: str, period_kind: str
+    ) -> list[tuple[str, str, str | None]]:
+        """Return (label, model, period key) for filtered rows whose label is selected.
+
+        The period key is None when the row's date cannot be parsed. Results are
+        memoized per filter selection so the popup aggregators share one pass.
+        """
+        label_idx = find_header_index(label_field)
+        if label_idx is None:
+            return []
+        model_idx = find_header_index("Model")
+        date_idx = find_header_index("Start time")
+        if period_kind != "all" and date_idx is None:
+            return []
+        name_set = frozenset(label_names)
+        cache_key = (filter_signature(), label_field, name_set, period_kind)
+        cached = row_index_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # load_csv_file only keeps rows as wide as the header, so header indexes
+        # are always in range and cells can be fetched without bounds checks.
+        get_label = itemgetter(label_idx)
+        get_model = itemgetter(model_idx) if model_idx is not None else (lambda _row: "")
+        entries: list[tuple[str, str, str | None]] = []
+        if period_kind == "all":
+            for row in get_filtered_rows():
+                label_val = get_label(row)
+                if label_val in name_set:
+                    entries.append((label_val, get_model(row), "Sum"))
+        else:
+            get_date = itemgetter(date_idx)
+            for row in get_filtered_rows():
+                label_val = get_label(row)
+                if label_val in name_set:
+                    entries.append(
+                        (label_val, get_model(row), period_key_for(get_date(row), period_kind))
+                    )
+
+        if len(row_index_cache) >= 16:
+            row_index_cache.clear()
+        row_index_cache[cache_key] = entries
+        return entries
+
     def compute_date_range_for_labels(
         label_names: list[str], label_field: str
     ) -> tuple[str, str] | None:
@@ -1462,19 +1891,16 @@ def build_ui() -> None:
         label_idx = find_header_index(label_field)
         if date_idx is None or label_idx is None:
             return None
-        min_dt: datetime | None = None
-        max_dt: datetime | None = None
-        rows_source = get_filtered_rows()
-        for row in rows_source:
-            if label_idx < len(row) and row[label_idx] in label_names:
-                dt = parse_date(row[date_idx]) if date_idx < len(row) else None
-                if dt:
-                    if min_dt is None or dt < min_dt:
-                        min_dt = dt
-                    if max_dt is None or dt > max_dt:
-                        max_dt = dt
-        if min_dt and max_dt:
-            return min_dt.strftime("%Y-%m-%d"), max_dt.strftime("%Y-%m-%d")
+        name_set = frozenset(label_names)
+        get_label = itemgetter(label_idx)
+        get_date = itemgetter(date_idx)
+        parsed = [
+            dt
+            for row in get_filtered_rows()
+            if get_label(row) in name_set and (dt := parse_date(get_date(row)))
+        ]
+        if parsed:
+            return min(parsed).strftime("%Y-%m-%d"), max(parsed).strftime("%Y-%m-%d")
         return None
 
     def aggregate_selected_counts(
@@ -1486,37 +1912,19 @@ def build_ui() -> None:
             return [], []
         if period_kind != "all" and date_idx is None:
             return [], []
-        counts_by_period: dict[str, int] = {}
-        rows_source = get_filtered_rows()
-        for row in rows_source:
-            label_val = row[label_idx] if label_idx < len(row) else ""
-            if label_val not in label_names:
-                continue
-            if period_kind == "all":
-                period_key = "Sum"
-            else:
-                date_val = row[date_idx] if date_idx < len(row) else ""
-                dt = parse_date(date_val)
-                if not dt:
-                    continue
-                if period_kind == "day":
-                    period_key = dt.strftime("%Y-%m-%d")
-                elif period_kind == "week":
-                    iso_year, iso_week, _ = dt.isocalendar()
-                    period_key = f"{iso_year}-W{iso_week:02d}"
-                elif period_kind == "month":
-                    period_key = dt.strftime("%Y-%m")
-                elif period_kind == "quarter":
-                    q = (dt.month - 1) // 3 + 1
-                    period_key = f"{dt.year}-Q{q}"
-                else:
-                    period_key = "Sum"
-            counts_by_period[period_key] = counts_by_period.get(period_key, 0) + 1
+        # Group-by-period count in one C-level Counter pass over the shared row index.
+        counts_by_period = Counter(
+            period_key
+            for _label_val, _model_val, period_key in build_row_index(
+                label_names, label_field, period_kind
+            )
+            if period_key is not None
+        )
 
         period_order = list(counts_by_period.keys())
         if period_kind != "all":
             period_order = sort_period_labels(period_order)
-        counts = [counts_by_period.get(period, 0) for period in period_order]
+        counts = list(map(counts_by_period.__getitem__, period_order))
         return period_order, counts
 
     def build_selected_pivot(
@@ -1532,43 +1940,15 @@ def build_ui() -> None:
         if period_kind != "all" and date_idx is None:
             return [], []
 
-        label_order: list[str] = []
-        period_order: list[str] = []
-        totals: dict[str, dict[str, int]] = {}
-
-        def remember(value: str, collection: list[str]) -> None:
-            if value not in collection:
-                collection.append(value)
-
-        rows_source = get_filtered_rows()
-        for row in rows_source:
-            label_val = row[label_idx] if label_idx < len(row) else ""
-            if label_val not in label_names:
-                continue
-            remember(label_val, label_order)
-
-            if period_kind == "all":
-                period_key = "Sum"
-            else:
-                date_val = row[date_idx] if date_idx < len(row) else ""
-                dt = parse_date(date_val)
-                if not dt:
-                    continue
-                if period_kind == "day":
-                    period_key = dt.strftime("%Y-%m-%d")
-                elif period_kind == "week":
-                    iso_year, iso_week, _ = dt.isocalendar()
-                    period_key = f"{iso_year}-W{iso_week:02d}"
-                elif period_kind == "month":
-                    period_key = dt.strftime("%Y-%m")
-                elif period_kind == "quarter":
-                    q = (dt.month - 1) // 3 + 1
-                    period_key = f"{dt.year}-Q{q}"
-                else:
-                    period_key = "Sum"
-            remember(period_key, period_order)
-            totals.setdefault(label_val, {})
-            totals[label_val][period_key] = totals[label_val].get(period_key, 0) + 1
+        entries = build_row_index(label_names, label_field, period_kind)
+        # Labels keep first-seen order even when none of their dates parse.
+        label_order = list(dict.fromkeys(label_val for label_val, _model_val, _key in entries))
+        pairs = [
+            (label_val, period_key)
+            for label_val, _model_val, period_key in entries
+            if period_key is not None
+        ]
+        period_order = list(dict.fromkeys(period_key for _label_val, period_key in pairs))
 
         if period_kind != "all":
             period_order = sort_period_labels(period_order)
@@ -1576,15 +1956,53 @@ def build_ui() -> None:
             period_order = ["Sum"]
 
         headers = [label_kind if label_kind else "Label"] + period_order
-        rows: list[list[str]] = []
-        for label_val in label_order:
-            row_counts = totals.get(label_val, {})
-            rows.append(
-                [label_val]
-                + [str(row_counts.get(period, 0)) for period in period_order]
-            )
+        matrix = _pivot_count_matrix(pairs, label_order, period_order)
+        rows = [
+            [label_val] + cells
+            for label_val, cells in zip(label_order, matrix.astype(str).tolist())
+        ]
         return headers, rows
 
+    # Figure and canvas kept per chart frame so redraws re-plot into the same
+    # widget instead of building a new FigureCanvasTkAgg each time.
+    chart_canvases: dict[str, tuple] = {}
+    # Inputs each main-window chart was last drawn from; a redraw with the same
+    # inputs is skipped. Reset on load and when the source table is repopulated.
+    chart_draw_keys: dict[str, tuple] = {}
+    # Inputs the model and pivot tables were last built from, so a rebuild
+    # with the same inputs is skipped. Reset on load and when a table is cleared.
+    table_build_keys: dict[str, tuple] = {}
+    # Invalid Start time rows skipped by the last model table build, keyed by
+    # its build key, so a skipped rebuild can still report them.
+    model_invalid_date_rows: dict[tuple, int] = {}
+
+    def reset_chart_frame(frame: ttk.Frame) -> None:
+        """Clear status labels from a chart frame, hiding rather than destroying its canvas."""
+        entry = chart_canvases.get(str(frame))
+        keep = entry[1].get_tk_widget() if entry else None
+        for child in frame.winfo_children():
+            if child is keep:
+                child.pack_forget()
+            else:
+                child.destroy()
+
+    def chart_figure(frame: ttk.Frame, figsize: tuple[float, float]) -> tuple:
+        """Return (fig, ax, canvas) for a frame, reusing its cleared Figure when present."""
+        entry = chart_canvases.get(str(frame))
+        if entry is None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from matplotlib.figure import Figure
+
+            fig = Figure(figsize=figsize, dpi=100)
+            entry = chart_canvases[str(frame)] = (fig, FigureCanvasTkAgg(fig, master=frame))
+        fig, canvas = entry
+        fig.clear()
+        return fig, fig.add_subplot(111), canvas
+
+    def show_chart_canvas(canvas) -> None:
+        canvas.draw_idle()
+        canvas.get_tk_widget().pack(fill="both", expand=True)
+
     def show_label_popup(
         label: str,
         periods: list[str],
@@ -1607,11 +2025,12 @@ def build_ui() -> None:
         container.pack(fill="both", expand=True)
         ttk.Label(container, text=f"{label_kind}: {label}").pack(anchor="w")
         # Date range display
-        parsed_dates = [parse_period_label(p) for p in periods if parse_period_label(p)]
+        parsed_dates: list[datetime | None] = [parse_period_label(p) for p in periods]
+        valid_dates = [dt for dt in parsed_dates if dt]
         range_text: str | None = None
-        if parsed_dates:
-            start = min(parsed_dates).strftime("%Y-%m-%d")
-            end = max(parsed_dates).strftime("%Y-%m-%d")
+        if valid_dates:
+            start = min(valid_dates).strftime("%Y-%m-%d")
+            end = max(valid_dates).strftime("%Y-%m-%d")
             range_text = f"Date range: {start} to {end}"
         if range_text:
             ttk.Label(container, text=range_text).pack(anchor="w")
@@ -1624,30 +2043,18 @@ def build_ui() -> None:
             ttk.Button(container, text="Close", command=alert_popup.destroy).pack(anchor="e", pady=(6, 0))
             return
 
+        import matplotlib.dates as mdates
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
         fig = Figure(figsize=(7.4, 3.6), dpi=100)
         ax = fig.add_subplot(111)
         fig_canvas: FigureCanvasTkAgg | None = None
 
-        def linear_regression(xs: list[float], ys: list[float]) -> tuple[float, float] | None:
-            if len(xs) < 2:
-                return None
-            n = len(xs)
-            sum_x = sum(xs)
-            sum_y = sum(ys)
-            sum_xx = sum(x * x for x in xs)
-            sum_xy = sum(x * y for x, y in zip(xs, ys))
-            denom = (n * sum_xx - sum_x * sum_x)
-            if denom == 0:
-                return None
-            slope = (n * sum_xy - sum_x * sum_y) / denom
-            intercept = (sum_y - slope * sum_x) / n
-            return slope, intercept
-
-        parsed_dates: list[datetime | None] = [parse_period_label(p) for p in periods]
-        all_parsed = period_kind != "apm" and all(d is not None for d in parsed_dates)
+        all_parsed = period_kind != "apm" and None not in parsed_dates
 
         if all_parsed and parsed_dates:
-            x_vals = [mdates.date2num(dt) for dt in parsed_dates]
+            x_vals = mdates.date2num(parsed_dates)
             colors = ["#5b8def"] * len(counts)
             if period_kind == "apm":
                 # Highlight top 3 counts
@@ -1673,7 +2080,7 @@ def build_ui() -> None:
             ax.set_xlabel("APM" if period_kind == "apm" else "Period")
 
         if period_kind != "apm":
-            lr = linear_regression(x_vals, counts)
+            lr = _linear_regression(x_vals, counts)
             if lr:
                 slope, intercept = lr
                 x_min, x_max = min(x_vals), max(x_vals)
@@ -1682,7 +2089,7 @@ def build_ui() -> None:
                 ax.plot(x_line, y_line, color="#d9534f", linestyle="--", linewidth=1.5, label="Trend (linear)")
 
             if counts:
-                avg = sum(counts) / len(counts)
+                avg = fmean(counts)
                 ax.axhline(avg, color="#f0ad4e", linestyle="-.", linewidth=1.5, label="Average")
 
             if lr or counts:
@@ -1698,7 +2105,7 @@ def build_ui() -> None:
 
         def sanitize_filename(text: str) -> str:
             fallback = label_kind.lower() if label_kind else "label"
-            return re.sub(r"[^A-Za-z0-9._-]+", "_", text.strip()) or fallback
+            return _SANITIZE_RE.sub("_", text.strip()) or fallback
 
         def derive_range() -> tuple[str, str]:
             if all_parsed and parsed_dates:
@@ -1728,6 +2135,9 @@ def build_ui() -> None:
     def show_duration_popup(
         label_names: list[str], label_kind: str, label_field: str
     ) -> None:
+        import matplotlib.dates as mdates
+        from matplotlib.figure import Figure
+
         nonlocal alert_popup
         if alert_popup is not None and alert_popup.winfo_exists():
             alert_popup.destroy()
@@ -1790,6 +2200,9 @@ def build_ui() -> None:
         chart_panes.pack(fill="both", expand=True, pady=(8, 4))
         chart_container = ttk.Frame(chart_panes)
         chart_panes.add(chart_container, weight=3)
+        chart_container.bind(
+            "<Destroy>", lambda _event: chart_canvases.pop(str(chart_container), None)
+        )
         bottom_container = ttk.Frame(chart_panes)
         chart_panes.add(bottom_container, weight=1)
         data_frame = ttk.LabelFrame(bottom_container, text="Filtered data (all columns)")
@@ -1813,16 +2226,14 @@ def build_ui() -> None:
             data_table.delete(*data_table.get_children())
             data_table.configure(columns=[])
 
-        def populate_data_table(headers: list[str], rows: list[list[str]]) -> None:
+        def populate_data_table(headers: list[str], rows: list[tuple[str, ...]]) -> None:
             clear_data_table()
             data_table.configure(columns=headers)
             widths = compute_column_widths(headers, rows, min_width=60, max_width=220)
             for idx, name in enumerate(headers):
                 data_table.heading(name, text=name)
                 data_table.column(name, width=widths[idx], anchor="w")
-            for row in rows:
-                values = row + [""] * (len(headers) - len(row))
-                data_table.insert("", "end", values=values[: len(headers)])
+            _insert_rows(data_table, rows, len(headers))
 
         def refresh_data_table() -> None:
             if not show_data_var.get():
@@ -1834,9 +2245,10 @@ def build_ui() -> None:
             if label_idx is None:
                 clear_data_table()
                 return
+            name_set = frozenset(label_names)
             rows_source = [
                 row for row in get_filtered_rows()
-                if label_idx < len(row) and row[label_idx] in label_names
+                if row[label_idx] in name_set
             ]
             populate_data_table(current_headers, rows_source)
 
@@ -1882,6 +2294,46 @@ def build_ui() -> None:
         pivot_y_scroll.pack(side="right", fill="y")
         pivot_x_scroll.pack(side="bottom", fill="x")
 
+        def aggregate_model_counts(
+            period_kind: str,
+        ) -> tuple[list[str], list[str], np.ndarray]:
+            """Return sorted periods, models by descending total, and a models x periods matrix.
+
+            Shared by the model chart and the model pivot, memoized per filter selection.
+            """
+            cache_key = (filter_signature(), label_field, frozenset(label_names), period_kind)
+            cached = model_counts_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            pairs: list[tuple[str, str]] = []
+            for _label_val, model_val, period_key in build_row_index(
+                label_names, label_field, period_kind
+            ):
+                if period_key is None:
+                    continue
+                model_val = model_val.strip() if isinstance(model_val, str) else str(model_val)
+                pairs.append((model_val or "Unclassified", period_key))
+            period_order = list(dict.fromkeys(period_key for _model_val, period_key in pairs))
+            if period_kind != "all":
+                period_order = sort_period_labels(period_order)
+            model_names = list(dict.fromkeys(model_val for model_val, _period_key in pairs))
+
+            matrix = _pivot_count_matrix(pairs, model_names, period_order)
+            model_totals = matrix.sum(axis=1).tolist()
+            model_order = sorted(
+                range(len(model_names)), key=lambda pos: model_totals[pos], reverse=True
+            )
+            result = (
+                period_order,
+                [model_names[pos] for pos in model_order],
+                matrix[model_order],
+            )
+            if len(model_counts_cache) >= 8:
+                model_counts_cache.clear()
+            model_counts_cache[cache_key] = result
+            return result
+
         def build_model_pivot(period_kind: str) -> tuple[list[str], list[list[str]]]:
             label_idx = find_header_index(label_field)
             model_idx = find_header_index("Model")
@@ -1891,61 +2343,12 @@ def build_ui() -> None:
             if period_kind != "all" and date_idx is None:
                 return [], []
 
-            period_order: list[str] = []
-            counts: dict[str, dict[str, int]] = {}
-            model_totals: dict[str, int] = {}
-
-            def remember(value: str, collection: list[str]) -> None:
-                if value not in collection:
-                    collection.append(value)
-
-            rows_source = get_filtered_rows()
-            for row in rows_source:
-                label_val = row[label_idx] if label_idx < len(row) else ""
-                if label_val not in label_names:
-                    continue
-                model_val = row[model_idx] if model_idx < len(row) else ""
-                if period_kind == "all":
-                    period_key = "Sum"
-                else:
-                    date_val = row[date_idx] if date_idx < len(row) else ""
-                    dt = parse_date(date_val)
-                    if not dt:
-                        continue
-                    if period_kind == "day":
-                        period_key = dt.strftime("%Y-%m-%d")
-                    elif period_kind == "week":
-                        iso_year, iso_week, _ = dt.isocalendar()
-                        period_key = f"{iso_year}-W{iso_week:02d}"
-                    elif period_kind == "month":
-                        period_key = dt.strftime("%Y-%m")
-                    elif period_kind == "quarter":
-                        q = (dt.month - 1) // 3 + 1
-                        period_key = f"{dt.year}-Q{q}"
-                    else:
-                        period_key = "Sum"
-                remember(period_key, period_order)
-                counts.setdefault(period_key, {})
-                counts[period_key][model_val] = counts[period_key].get(model_val, 0) + 1
-                model_totals[model_val] = model_totals.get(model_val, 0) + 1
-
-            if period_kind != "all":
-                period_order = sort_period_labels(period_order)
-            if not period_order:
-                period_order = ["Sum"]
-
-            model_order = sorted(
-                model_totals.keys(),
-                key=lambda name: model_totals.get(name, 0),
-                reverse=True,
-            )
-            headers = ["Model"] + period_order
-            rows: list[list[str]] = []
-            for model_name in model_order:
-                row = [model_name]
-                for period in period_order:
-                    row.append(str(counts.get(period, {}).get(model_name, 0)))
-                rows.append(row)
+            period_order, model_order, matrix = aggregate_model_counts(period_kind)
+            headers = ["Model"] + (period_order or ["Sum"])
+            rows = [
+                [model_name] + cells
+                for model_name, cells in zip(model_order, matrix.astype(str).tolist())
+            ]
             return headers, rows
 
         def update_pivot(period_kind: str) -> None:
@@ -1965,9 +2368,7 @@ def build_ui() -> None:
                 for idx, name in enumerate(headers):
                     pivot_table.heading(name, text=name)
                     pivot_table.column(name, width=widths[idx], anchor="w")
-            for row in rows:
-                values = row + [""] * (len(headers) - len(row))
-                pivot_table.insert("", "end", values=values[: len(headers)])
+            _insert_rows(pivot_table, rows, len(headers))
 
         def toggle_pivot() -> None:
             if pivot_toggle_var.get():
@@ -1979,8 +2380,7 @@ def build_ui() -> None:
         def update_chart(period_kind: str) -> None:
             nonlocal current_fig
             current_period["value"] = period_kind
-            for child in chart_container.winfo_children():
-                child.destroy()
+            reset_chart_frame(chart_container)
             computed_range = compute_date_range_for_labels(label_names, label_field)
             if computed_range:
                 range_var.set(f"Date range: {computed_range[0]} to {computed_range[1]}")
@@ -1995,51 +2395,7 @@ def build_ui() -> None:
                     ).pack(anchor="w", pady=(8, 0))
                     return
 
-                counts_by_period: dict[str, dict[str, int]] = {}
-                totals_by_model: dict[str, int] = {}
-                rows_source = get_filtered_rows()
-                date_idx = find_header_index("Start time")
-                for row in rows_source:
-                    label_idx = find_header_index(label_field)
-                    if label_idx is None:
-                        continue
-                    label_val = row[label_idx] if label_idx < len(row) else ""
-                    if label_val not in label_names:
-                        continue
-                    model_val = row[model_idx] if model_idx < len(row) else ""
-                    model_val = model_val.strip() if isinstance(model_val, str) else str(model_val)
-                    if not model_val:
-                        model_val = "Unclassified"
-                    if period_kind == "all":
-                        period_key = "Sum"
-                    else:
-                        if date_idx is None:
-                            continue
-                        date_val = row[date_idx] if date_idx < len(row) else ""
-                        dt = parse_date(date_val)
-                        if not dt:
-                            continue
-                        if period_kind == "day":
-                            period_key = dt.strftime("%Y-%m-%d")
-                        elif period_kind == "week":
-                            iso_year, iso_week, _ = dt.isocalendar()
-                            period_key = f"{iso_year}-W{iso_week:02d}"
-                        elif period_kind == "month":
-                            period_key = dt.strftime("%Y-%m")
-                        elif period_kind == "quarter":
-                            q = (dt.month - 1) // 3 + 1
-                            period_key = f"{dt.year}-Q{q}"
-                        else:
-                            period_key = "Sum"
-                    counts_by_period.setdefault(period_key, {})
-                    counts_by_period[period_key][model_val] = (
-                        counts_by_period[period_key].get(model_val, 0) + 1
-                    )
-                    totals_by_model[model_val] = totals_by_model.get(model_val, 0) + 1
-
-                periods = list(counts_by_period.keys())
-                if period_kind != "all":
-                    periods = sort_period_labels(periods)
+                periods, shown_models, model_matrix = aggregate_model_counts(period_kind)
                 if not periods:
                     ttk.Label(
                         chart_container,
@@ -2047,33 +2403,20 @@ def build_ui() -> None:
                     ).pack(anchor="w", pady=(8, 0))
                     return
 
-                shown_models = sorted(
-                    totals_by_model.keys(),
-                    key=lambda name: totals_by_model.get(name, 0),
-                    reverse=True,
-                )
-
-                series: dict[str, list[int]] = {m: [] for m in shown_models}
-                for period in periods:
-                    model_counts = counts_by_period.get(period, {})
-                    for model_name in shown_models:
-                        series[model_name].append(model_counts.get(model_name, 0))
-
-                if not any(sum(vals) for vals in series.values()):
+                if not model_matrix.any():
                     ttk.Label(
                         chart_container,
                         text=f"No data to chart for this {label_kind.lower()}.",
                     ).pack(anchor="w", pady=(8, 0))
                     return
 
-                fig = Figure(figsize=(7.4, 3.6), dpi=100)
-                ax = fig.add_subplot(111)
+                fig, ax, canvas = chart_figure(chart_container, (7.4, 3.6))
                 parsed_dates: list[datetime | None] = [
                     parse_period_label(p) for p in periods
                 ]
                 all_parsed = period_kind != "apm" and all(d is not None for d in parsed_dates)
                 if all_parsed and parsed_dates:
-                    x_vals = [mdates.date2num(dt) for dt in parsed_dates if dt is not None]
+                    x_vals = mdates.date2num(parsed_dates)
                     ax.xaxis_date()
                     formatter = mdates.DateFormatter("%Y-%m-%d")
                     ax.xaxis.set_major_formatter(formatter)
@@ -2086,26 +2429,23 @@ def build_ui() -> None:
                     ax.set_xlabel("Period")
 
                 palette = ["#5b8def", "#f0ad4e", "#5cb85c", "#d9534f", "#9370db", "#9e9e9e", "#5bc0de"]
-                bottom_vals = [0] * len(periods)
+                # Each model's bars sit on the running total of the models drawn before it.
+                bottoms = model_matrix.cumsum(axis=0) - model_matrix
                 for idx, model_name in enumerate(shown_models):
-                    vals = series.get(model_name, [0] * len(periods))
                     ax.bar(
                         x_vals,
-                        vals,
+                        model_matrix[idx],
                         width=0.8 if not all_parsed else 5,
-                        bottom=bottom_vals,
+                        bottom=bottoms[idx],
                         color=palette[idx % len(palette)],
                         edgecolor="#2f2f2f",
                         label=model_name,
                     )
-                    bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
                 ax.legend()
                 ax.set_ylabel(f"{label_kind} count")
                 ax.set_title(label_display)
 
-                canvas = FigureCanvasTkAgg(fig, master=chart_container)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True)
+                show_chart_canvas(canvas)
                 current_fig = fig
             else:
                 periods, counts = aggregate_selected_counts(
@@ -2118,33 +2458,16 @@ def build_ui() -> None:
                     ).pack(anchor="w", pady=(8, 0))
                     return
                 if period_kind != "apm":
-                    periods, counts = sort_periods(periods, counts)
-
-                fig = Figure(figsize=(7.4, 3.6), dpi=100)
-                ax = fig.add_subplot(111)
-
-                def linear_regression(xs: list[float], ys: list[float]) -> tuple[float, float] | None:
-                    if len(xs) < 2:
-                        return None
-                    n = len(xs)
-                    sum_x = sum(xs)
-                    sum_y = sum(ys)
-                    sum_xx = sum(x * x for x in xs)
-                    sum_xy = sum(x * y for x, y in zip(xs, ys))
-                    denom = (n * sum_xx - sum_x * sum_x)
-                    if denom == 0:
-                        return None
-                    slope = (n * sum_xy - sum_x * sum_y) / denom
-                    intercept = (sum_y - slope * sum_x) / n
-                    return slope, intercept
+                    periods, counts, parsed_dates = sort_periods_with_dates(periods, counts)
+                    all_parsed = None not in parsed_dates
+                else:
+                    parsed_dates = []
+                    all_parsed = False
 
-                parsed_dates: list[datetime | None] = [
-                    parse_period_label(p) for p in periods
-                ]
-                all_parsed = period_kind != "apm" and all(d is not None for d in parsed_dates)
+                fig, ax, canvas = chart_figure(chart_container, (7.4, 3.6))
 
                 if all_parsed and parsed_dates:
-                    x_vals = [mdates.date2num(dt) for dt in parsed_dates if dt is not None]
+                    x_vals = mdates.date2num(parsed_dates)
                     ax.bar(x_vals, counts, width=5, color="#5b8def", edgecolor="#2f5fb3")
                     ax.xaxis_date()
                     formatter = mdates.DateFormatter("%Y-%m-%d")
@@ -2158,7 +2481,7 @@ def build_ui() -> None:
                     ax.set_xticklabels(periods, rotation=45, ha="right")
                     ax.set_xlabel("Period")
 
-                lr = linear_regression(x_vals, counts)
+                lr = _linear_regression(x_vals, counts)
                 if lr:
                     slope, intercept = lr
                     x_min, x_max = min(x_vals), max(x_vals)
@@ -2174,7 +2497,7 @@ def build_ui() -> None:
                     )
 
                 if counts:
-                    avg = sum(counts) / len(counts)
+                    avg = fmean(counts)
                     ax.axhline(
                         avg,
                         color="#f0ad4e",
@@ -2189,24 +2512,53 @@ def build_ui() -> None:
                 ax.set_ylabel(f"{label_kind} count")
                 ax.set_title(label_display)
 
-                canvas = FigureCanvasTkAgg(fig, master=chart_container)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill="both", expand=True)
+                show_chart_canvas(canvas)
                 current_fig = fig
             if pivot_toggle_var.get():
                 update_pivot(period_kind)
-            if pivot_toggle_var.get():
-                update_pivot(period_kind)
             if show_data_var.get():
                 refresh_data_table()
 
         def save_chart() -> None:
             if current_fig is None:
                 return
-            fname_label = re.sub(r"[^A-Za-z0-9._-]+", "_", label_display.strip()) or label_kind.lower()
+            fname_label = _SANITIZE_RE.sub("_", label_display.strip()) or label_kind.lower()
             fname = f"{fname_label}-duration.png"
             path = BASE_DIR / fname
-            current_fig.savefig(path)
+            # Render now so a draw_idle() still queued by update_chart cannot leave
+            # the previous chart in the buffer, then copy the pixels and encode the
+            # PNG off the Tk thread; the figure itself is reused by the next redraw.
+            from matplotlib.image import imsave
+
+            canvas = current_fig.canvas
+            canvas.draw()
+            pixels = np.array(canvas.buffer_rgba())
+            dpi = current_fig.dpi
+
+            # The worker only fills this queue; Tk is polled and updated from the
+            # main loop, so a window closed mid-save is never touched off-thread.
+            outcome: queue.Queue[tuple[str, str]] = queue.Queue(maxsize=1)
+
+            def write_png() -> None:
+                try:
+                    imsave(path, pixels, dpi=dpi)
+                except Exception as exc:
+                    outcome.put((f"Failed to save {fname}: {exc}", "red"))
+                else:
+                    outcome.put((f"Saved {fname}", "green"))
+
+            def report() -> None:
+                try:
+                    message, color = outcome.get_nowait()
+                except queue.Empty:
+                    root.after(100, report)
+                    return
+                status_var.set(message)
+                set_status_color(color)
+
+            # Not a daemon: exiting mid-write must not leave a truncated PNG.
+            threading.Thread(target=write_png).start()
+            root.after(100, report)
 
         ttk.Button(
             button_row, text="All day", command=lambda: update_chart("all")
@@ -2240,35 +2592,31 @@ def build_ui() -> None:
         sel = table.selection()
         if not sel:
             status_var.set(f"Select one or more {label_kind.lower()}s, then press 'A'")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             return
 
         periods = list(table["columns"])[1:]
         if not periods and period_kind == "apm":
             status_var.set("No periods available for chart")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             return
 
         labels: list[str] = []
-        totals = [0 for _ in periods]
+        totals = np.zeros(len(periods), dtype=np.int64)
         for row_id in sel:
-            item = table.item(row_id)
-            values = item.get("values", [])
+            values = row_values(table, row_id)
             if not values:
                 continue
             label = str(values[0])
-            if label in {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}:
+            if label in _PERIOD_META_LABEL_SET:
                 continue
             labels.append(label)
-            for idx, val in enumerate(values[1 : len(periods) + 1]):
-                try:
-                    totals[idx] += int(val)
-                except (TypeError, ValueError):
-                    continue
+            counts = row_counts(table, row_id)[: len(periods)]
+            totals[: len(counts)] += counts
 
         if not labels:
             status_var.set(f"No {label_kind.lower()} rows selected")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             return
 
         if period_kind == "apm":
@@ -2276,15 +2624,27 @@ def build_ui() -> None:
                 label = labels[0]
             else:
                 label = f"{len(labels)} {label_kind.lower()}s"
-            show_label_popup(label, periods, totals, period_kind, label_kind)
+            show_label_popup(label, periods, totals.tolist(), period_kind, label_kind)
         else:
             show_duration_popup(labels, label_kind, label_field)
 
     def draw_bar_chart() -> None:
         headers = list(fleet_table["columns"])
         period = chart_period_var.get()
-        for child in chart_canvas_frame.winfo_children():
-            child.destroy()
+        draw_key = (
+            period,
+            fleet_period_var.get(),
+            total_count_var.get(),
+            hw_sw_chart_var.get(),
+            work_type_chart_var.get(),
+            icr_chart_var.get(),
+            accident_chart_var.get(),
+            filter_signature(),
+        )
+        if chart_draw_keys.get("fleet") == draw_key:
+            return
+        chart_draw_keys["fleet"] = draw_key
+        reset_chart_frame(chart_canvas_frame)
         if not headers or not period:
             ttk.Label(
                 chart_canvas_frame, text="Load data and choose a chart period."
@@ -2300,47 +2660,7 @@ def build_ui() -> None:
             populate_id_table([])
             return
 
-        def normalize_hw_sw(value: str) -> str:
-            val = (value or "").strip().lower()
-            if "hard" in val:
-                return "Hardware"
-            if "soft" in val:
-                return "Software"
-            return "Other"
-
-        def normalize_work_type(value: str) -> str:
-            val = (value or "").strip().lower()
-            if "cmt" in val:
-                return "CMT"
-            if "pm" in val:
-                return "PM"
-            if "upgrade" in val:
-                return "Upgrade"
-            if "internal" in val:
-                return "Internal testing"
-            if "inspect" in val:
-                return "Inspection"
-            return "Other"
-
-        def normalize_icr(value: str) -> str:
-            val = (value or "").strip().lower()
-            if "inspect" in val:
-                return "Inspection"
-            if "change" in val:
-                return "Change"
-            if "rework" in val:
-                return "Rework"
-            return "Other"
-
-        alerts: list[str] = []
-        for row_id in fleet_table.get_children():
-            row_vals = fleet_table.item(row_id)["values"]
-            if len(row_vals) <= period_idx:
-                continue
-            label = str(row_vals[0])
-            if label in {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}:
-                continue  # skip metadata rows
-            alerts.append(label)
+        alerts, table_counts = period_column_counts(fleet_table, period_idx)
 
         if not alerts:
             ttk.Label(chart_canvas_frame, text="No data to chart.").pack(anchor="nw")
@@ -2392,87 +2712,65 @@ def build_ui() -> None:
                 return
 
             if hw_sw_chart_var.get():
-                counts_by_comp: dict[str, dict[str, int]] = {
-                    comp: {"Hardware": 0, "Software": 0, "Other": 0} for comp in alerts
-                }
+                buckets = ["Hardware", "Software", "Other"]
+                bucket_idx, normalize_bucket = hw_idx, normalize_hw_sw
             elif work_type_chart_var.get():
                 buckets = ["CMT", "PM", "Upgrade", "Internal testing", "Inspection", "Other"]
-                counts_by_comp = {comp: {b: 0 for b in buckets} for comp in alerts}
+                bucket_idx, normalize_bucket = wt_idx, normalize_work_type
             elif icr_chart_var.get():
                 buckets = ["Inspection", "Change", "Rework", "Other"]
-                counts_by_comp = {comp: {b: 0 for b in buckets} for comp in alerts}
+                bucket_idx, normalize_bucket = icr_idx, normalize_icr
             else:
                 buckets = ["Yes", "No"]
-                counts_by_comp = {comp: {b: 0 for b in buckets} for comp in alerts}
+                bucket_idx, normalize_bucket = acc_idx, normalize_accident
+            comp_pos = {comp: pos for pos, comp in enumerate(dict.fromkeys(alerts))}
+            bucket_pos = {bucket: pos for pos, bucket in enumerate(buckets)}
             rows_source = get_filtered_rows()
+            period_kind = fleet_period_var.get()
 
-            for row in rows_source:
-                comp_val = row[comp_idx] if comp_idx < len(row) else ""
-                if comp_val not in counts_by_comp:
-                    continue
-                if fleet_period_var.get() == "all":
-                    period_key = "Sum"
-                else:
-                    date_val = row[date_idx] if date_idx < len(row) else ""
-                    dt = parse_date(date_val)
-                    if not dt:
-                        continue
-                    if fleet_period_var.get() == "day":
-                        period_key = dt.strftime("%Y-%m-%d")
-                    elif fleet_period_var.get() == "week":
-                        iso_year, iso_week, _ = dt.isocalendar()
-                        period_key = f"{iso_year}-W{iso_week:02d}"
-                    elif fleet_period_var.get() == "month":
-                        period_key = dt.strftime("%Y-%m")
-                    elif fleet_period_var.get() == "quarter":
-                        q = (dt.month - 1) // 3 + 1
-                        period_key = f"{dt.year}-Q{q}"
-                    else:
-                        period_key = "Sum"
-                if period_key != period:
-                    continue
-
-                if hw_sw_chart_var.get():
-                    hw_bucket = normalize_hw_sw(row[hw_idx] if hw_idx < len(row) else "")
-                    counts_by_comp[comp_val][hw_bucket] += 1
-                elif work_type_chart_var.get():
-                    wt_bucket = normalize_work_type(row[wt_idx] if wt_idx < len(row) else "")
-                    counts_by_comp[comp_val][wt_bucket] += 1
-                elif icr_chart_var.get():
-                    icr_bucket = normalize_icr(row[icr_idx] if icr_idx < len(row) else "")
-                    counts_by_comp[comp_val][icr_bucket] += 1
+            # Group by (component, raw bucket cell) first so each distinct cell
+            # value is normalized once rather than once per row.
+            pair_of = itemgetter(comp_idx, bucket_idx)
+            if period_kind == "all":
+                if period == "Sum":
+                    pair_counts = Counter(
+                        pair for pair in map(pair_of, rows_source) if pair[0] in comp_pos
+                    )
                 else:
-                    acc_val = row[acc_idx] if acc_idx < len(row) else ""
-                    acc_val = acc_val.strip().lower() if isinstance(acc_val, str) else str(acc_val).lower()
-                    bucket = "Yes" if acc_val in {"yes", "y", "true", "1"} else "No"
-                    counts_by_comp[comp_val][bucket] += 1
+                    pair_counts = Counter()
+            else:
+                pair_counts = Counter(
+                    pair_of(row)
+                    for row in rows_source
+                    if row[comp_idx] in comp_pos
+                    and period_key_for(row[date_idx], period_kind) == period
+                )
+            n_pairs = len(pair_counts)
+            comp_codes = np.fromiter(
+                (comp_pos[comp_val] for comp_val, _ in pair_counts), dtype=np.intp, count=n_pairs
+            )
+            bucket_codes = np.fromiter(
+                (bucket_pos[normalize_bucket(raw)] for _, raw in pair_counts),
+                dtype=np.intp,
+                count=n_pairs,
+            )
+            pair_totals = np.fromiter(pair_counts.values(), dtype=np.int64, count=n_pairs)
+            counts_by_comp = np.bincount(
+                comp_codes * len(buckets) + bucket_codes,
+                weights=pair_totals,
+                minlength=len(comp_pos) * len(buckets),
+            ).astype(np.int64).reshape(len(comp_pos), len(buckets))
+            # Back to one row per alert, in table order.
+            counts_by_comp = counts_by_comp[[comp_pos[comp] for comp in alerts]]
 
             if hw_sw_chart_var.get():
-                for comp in alerts:
-                    hw_counts.append(counts_by_comp[comp]["Hardware"])
-                    sw_counts.append(counts_by_comp[comp]["Software"])
-                    other_counts.append(counts_by_comp[comp]["Other"])
+                hw_counts, sw_counts, other_counts = (col.tolist() for col in counts_by_comp.T)
             elif work_type_chart_var.get():
-                for bucket in ["CMT", "PM", "Upgrade", "Internal testing", "Inspection", "Other"]:
-                    wt_counts[bucket] = [counts_by_comp[c][bucket] for c in alerts]
-            elif icr_chart_var.get():
-                for bucket in ["Inspection", "Change", "Rework", "Other"]:
-                    icr_counts[bucket] = [counts_by_comp[c][bucket] for c in alerts]
+                wt_counts = dict(zip(buckets, (col.tolist() for col in counts_by_comp.T)))
             else:
-                icr_counts["Yes"] = [counts_by_comp[c]["Yes"] for c in alerts]
-                icr_counts["No"] = [counts_by_comp[c]["No"] for c in alerts]
+                icr_counts = dict(zip(buckets, (col.tolist() for col in counts_by_comp.T)))
         else:
-            for row_id in fleet_table.get_children():
-                row_vals = fleet_table.item(row_id)["values"]
-                if len(row_vals) <= period_idx:
-                    continue
-                label = str(row_vals[0])
-                if label in {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}:
-                    continue
-                try:
-                    counts.append(int(row_vals[period_idx]))
-                except (ValueError, TypeError):
-                    counts.append(0)
+            counts = table_counts
 
         if hw_sw_chart_var.get():
             if not any(hw_counts) and not any(sw_counts) and not any(other_counts):
@@ -2507,8 +2805,7 @@ def build_ui() -> None:
             ids_to_alerts.append((id_label, alert_name))
             id_labels.append(id_label)
 
-        fig = Figure(figsize=(7.2, 3.2), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax, canvas = chart_figure(chart_canvas_frame, (7.2, 3.2))
         x_vals = list(range(len(alerts)))
         if hw_sw_chart_var.get():
             ax.bar(x_vals, hw_counts, width=0.8, color="#5b8def", edgecolor="#2f5fb3", label="Hardware")
@@ -2517,68 +2814,47 @@ def build_ui() -> None:
                 bottom_vals = [h + s for h, s in zip(hw_counts, sw_counts)]
                 ax.bar(x_vals, other_counts, width=0.8, bottom=bottom_vals, color="#9e9e9e", edgecolor="#6f6f6f", label="Other")
             ax.legend()
-        elif work_type_chart_var.get():
-            colors = {
-                "CMT": "#5b8def",
-                "PM": "#f0ad4e",
-                "Upgrade": "#9370db",
-                "Internal testing": "#5cb85c",
-                "Inspection": "#d9534f",
-                "Other": "#9e9e9e",
-            }
-            bottom_vals = [0] * len(alerts)
-            for bucket in ["CMT", "PM", "Upgrade", "Internal testing", "Inspection", "Other"]:
-                vals = wt_counts.get(bucket, [0] * len(alerts))
-                ax.bar(
-                    x_vals,
-                    vals,
-                    width=0.8,
-                    bottom=bottom_vals,
-                    color=colors[bucket],
-                    edgecolor="#2f2f2f",
-                    label=bucket,
-                )
-                bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
-            ax.legend()
-        elif icr_chart_var.get():
-            colors = {
-                "Inspection": "#5b8def",
-                "Change": "#f0ad4e",
-                "Rework": "#5cb85c",
-                "Other": "#9e9e9e",
-            }
-            bottom_vals = [0] * len(alerts)
-            for bucket in ["Inspection", "Change", "Rework", "Other"]:
-                vals = icr_counts.get(bucket, [0] * len(alerts))
-                ax.bar(
-                    x_vals,
-                    vals,
-                    width=0.8,
-                    bottom=bottom_vals,
-                    color=colors[bucket],
-                    edgecolor="#2f2f2f",
-                    label=bucket,
-                )
-                bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
-            ax.legend()
-        elif accident_chart_var.get():
-            colors = {
-                "Yes": "#d9534f",
-                "No": "#5cb85c",
-            }
-            bottom_vals = [0] * len(alerts)
-            for bucket in ["Yes", "No"]:
-                vals = icr_counts.get(bucket, [0] * len(alerts))
+        elif work_type_chart_var.get() or icr_chart_var.get() or accident_chart_var.get():
+            if work_type_chart_var.get():
+                bucket_counts = wt_counts
+                colors = {
+                    "CMT": "#5b8def",
+                    "PM": "#f0ad4e",
+                    "Upgrade": "#9370db",
+                    "Internal testing": "#5cb85c",
+                    "Inspection": "#d9534f",
+                    "Other": "#9e9e9e",
+                }
+            elif icr_chart_var.get():
+                bucket_counts = icr_counts
+                colors = {
+                    "Inspection": "#5b8def",
+                    "Change": "#f0ad4e",
+                    "Rework": "#5cb85c",
+                    "Other": "#9e9e9e",
+                }
+            else:
+                bucket_counts = icr_counts
+                colors = {
+                    "Yes": "#d9534f",
+                    "No": "#5cb85c",
+                }
+            # One row per bucket; each bucket stacks on the running total below it.
+            bucket_matrix = np.array(
+                [bucket_counts.get(bucket, [0] * len(alerts)) for bucket in colors],
+                dtype=np.int64,
+            ).reshape(len(colors), len(alerts))
+            bottoms = bucket_matrix.cumsum(axis=0) - bucket_matrix
+            for (bucket, color), vals, bottom_vals in zip(colors.items(), bucket_matrix, bottoms):
                 ax.bar(
                     x_vals,
                     vals,
                     width=0.8,
                     bottom=bottom_vals,
-                    color=colors[bucket],
+                    color=color,
                     edgecolor="#2f2f2f",
                     label=bucket,
                 )
-                bottom_vals = [b + v for b, v in zip(bottom_vals, vals)]
             ax.legend()
         else:
             ax.bar(x_vals, counts, width=0.8, color="#5b8def", edgecolor="#2f5fb3")
@@ -2587,9 +2863,7 @@ def build_ui() -> None:
         ax.set_ylabel("Count")
         ax.set_title(f"Period: {period}")
 
-        canvas = FigureCanvasTkAgg(fig, master=chart_canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        show_chart_canvas(canvas)
 
         id_table.heading("Component", text="Component")
         populate_id_table(ids_to_alerts)
@@ -2597,8 +2871,10 @@ def build_ui() -> None:
     def draw_model_chart() -> None:
         headers = list(model_table["columns"])
         period = model_chart_period_var.get()
-        for child in model_chart_canvas_frame.winfo_children():
-            child.destroy()
+        if chart_draw_keys.get("model") == (period,):
+            return
+        chart_draw_keys["model"] = (period,)
+        reset_chart_frame(model_chart_canvas_frame)
         if not headers or not period:
             ttk.Label(model_chart_canvas_frame, text="Load data and choose a chart period.").pack(anchor="nw")
             populate_model_id_table([])
@@ -2610,20 +2886,7 @@ def build_ui() -> None:
             populate_model_id_table([])
             return
 
-        models: list[str] = []
-        counts: list[int] = []
-        for row_id in model_table.get_children():
-            row_vals = model_table.item(row_id)["values"]
-            if len(row_vals) <= period_idx:
-                continue
-            label = str(row_vals[0])
-            if label in {"YEAR", "MONTH", "DAY", "WEEK", "QUARTER"}:
-                continue
-            models.append(label)
-            try:
-                counts.append(int(row_vals[period_idx]))
-            except (ValueError, TypeError):
-                counts.append(0)
+        models, counts = period_column_counts(model_table, period_idx)
 
         if not counts:
             ttk.Label(model_chart_canvas_frame, text="No data to chart.").pack(anchor="nw")
@@ -2637,8 +2900,7 @@ def build_ui() -> None:
             ids_to_models.append((id_label, model_name))
             id_labels.append(id_label)
 
-        fig = Figure(figsize=(7.2, 3.2), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax, canvas = chart_figure(model_chart_canvas_frame, (7.2, 3.2))
         x_vals = list(range(len(counts)))
         ax.bar(x_vals, counts, width=0.8, color="#5b8def", edgecolor="#2f5fb3")
         ax.set_xticks(x_vals)
@@ -2646,9 +2908,7 @@ def build_ui() -> None:
         ax.set_ylabel("Count")
         ax.set_title(f"Period: {period}")
 
-        canvas = FigureCanvasTkAgg(fig, master=model_chart_canvas_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        show_chart_canvas(canvas)
 
         populate_model_id_table(ids_to_models)
 
@@ -2663,54 +2923,74 @@ def build_ui() -> None:
         return [part for part in parts if part]
 
     def filter_rows_by_field_keywords(
-        rows: list[list[str]], field_name: str, keywords_text: str
-    ) -> tuple[list[list[str]], str | None]:
+        indexes: list[int], field_name: str, keywords_text: str
+    ) -> tuple[list[int], str | None]:
+        """Keep the positions in current_rows whose field matches any keyword."""
         tokens = parse_keywords(keywords_text)
         if not tokens:
-            return rows, None
+            return indexes, None
         field_idx = find_header_index(field_name)
         if field_idx is None:
             return [], f"Missing '{field_name}' column for keyword search"
-        lowered = [token.lower() for token in tokens]
-        filtered: list[list[str]] = []
-        for row in rows:
-            cell = row[field_idx] if field_idx < len(row) else ""
-            text = str(cell).lower()
-            if any(token in text for token in lowered):
-                filtered.append(row)
+        lowered = lower_cell_cache.get(field_idx)
+        if lowered is None:
+            lowered = lower_cell_cache[field_idx] = [
+                str(row[field_idx]).lower() for row in current_rows
+            ]
+        search = _keyword_pattern(tuple(token.lower() for token in tokens)).search
+        # Model/Component cells repeat heavily; search each distinct text once.
+        hits: dict[str, bool] = {}
+        filtered: list[int] = []
+        for pos in indexes:
+            text = lowered[pos]
+            hit = hits.get(text)
+            if hit is None:
+                hit = hits[text] = search(text) is not None
+            if hit:
+                filtered.append(pos)
         return filtered, None
 
     def refresh_keyword_view() -> None:
-        for child in keyword_chart_body.winfo_children():
-            child.destroy()
+        draw_key = (
+            keyword_filter_var.get(),
+            keyword_filter_var_2.get(),
+            keyword_model_filter_var.get(),
+            keyword_component_filter_var.get(),
+            keyword_vehicle_chart_var.get(),
+            filter_signature(),
+        )
+        if current_headers and chart_draw_keys.get("keyword") == draw_key:
+            return
+        chart_draw_keys["keyword"] = draw_key
+        reset_chart_frame(keyword_chart_body)
         if not current_headers:
             keyword_status_var.set("Load a CSV to view keyword data")
             clear_keyword_table()
             return
 
-        rows_source = get_filtered_rows()
-        rows_filtered = rows_source
+        indexes_filtered = get_filtered_indexes()
         missing_messages: list[str] = []
-        rows_filtered, missing = filter_rows_by_field_keywords(
-            rows_filtered, "Work done", keyword_filter_var.get()
+        indexes_filtered, missing = filter_rows_by_field_keywords(
+            indexes_filtered, "Work done", keyword_filter_var.get()
         )
         if missing:
             missing_messages.append(missing)
-        rows_filtered, missing = filter_rows_by_field_keywords(
-            rows_filtered, "Work done", keyword_filter_var_2.get()
+        indexes_filtered, missing = filter_rows_by_field_keywords(
+            indexes_filtered, "Work done", keyword_filter_var_2.get()
         )
         if missing:
             missing_messages.append(missing)
-        rows_filtered, missing = filter_rows_by_field_keywords(
-            rows_filtered, "Model", keyword_model_filter_var.get()
+        indexes_filtered, missing = filter_rows_by_field_keywords(
+            indexes_filtered, "Model", keyword_model_filter_var.get()
         )
         if missing:
             missing_messages.append(missing)
-        rows_filtered, missing = filter_rows_by_field_keywords(
-            rows_filtered, "Component", keyword_component_filter_var.get()
+        indexes_filtered, missing = filter_rows_by_field_keywords(
+            indexes_filtered, "Component", keyword_component_filter_var.get()
         )
         if missing:
             missing_messages.append(missing)
+        rows_filtered = [current_rows[pos] for pos in indexes_filtered]
         if missing_messages:
             keyword_status_var.set("; ".join(missing_messages))
         elif (
@@ -2730,9 +3010,8 @@ def build_ui() -> None:
         draw_keyword_chart(rows_filtered)
 
 
-    def draw_keyword_chart(rows_filtered: list[list[str]]) -> None:
-        for child in keyword_chart_body.winfo_children():
-            child.destroy()
+    def draw_keyword_chart(rows_filtered: list[tuple[str, ...]]) -> None:
+        reset_chart_frame(keyword_chart_body)
         counts: dict[str, int] = {}
         label_kind = "Component"
         if keyword_vehicle_chart_var.get():
@@ -2743,22 +3022,17 @@ def build_ui() -> None:
                 ).pack(anchor="nw")
                 return
             label_kind = "Vehicle"
-            all_vehicles: list[str] = []
-            for row in current_rows:
-                apm_val = row[apm_idx] if apm_idx < len(row) else ""
-                apm_val = apm_val.strip() if isinstance(apm_val, str) else str(apm_val)
-                if not apm_val or not re.search(r"\d", apm_val):
-                    continue
-                if apm_val not in all_vehicles:
-                    all_vehicles.append(apm_val)
-            all_vehicles = sort_filter_values(all_vehicles)
-            counts = {vehicle: 0 for vehicle in all_vehicles}
-            for row in rows_filtered:
-                apm_val = row[apm_idx] if apm_idx < len(row) else ""
-                apm_val = apm_val.strip() if isinstance(apm_val, str) else str(apm_val)
-                if not apm_val or apm_val not in counts:
-                    continue
-                counts[apm_val] += 1
+            # Distinct cells first; strip and digit-test each once.
+            vehicles_seen: dict[str, None] = {}
+            for apm_val in dict.fromkeys(map(itemgetter(apm_idx), current_rows)):
+                apm_val = apm_val.strip()
+                if apm_val and _DIGIT_RE.search(apm_val):
+                    vehicles_seen[apm_val] = None
+            vehicle_counts = Counter(map(str.strip, map(itemgetter(apm_idx), rows_filtered)))
+            counts = {
+                vehicle: vehicle_counts[vehicle]
+                for vehicle in sort_filter_values(list(vehicles_seen))
+            }
             if not counts:
                 ttk.Label(
                     keyword_chart_body, text="No vehicles to chart."
@@ -2776,74 +3050,40 @@ def build_ui() -> None:
                     keyword_chart_body, text="Component column missing."
                 ).pack(anchor="nw")
                 return
-            for row in rows_filtered:
-                comp_val = row[comp_idx] if comp_idx < len(row) else ""
-                comp_val = comp_val.strip() if isinstance(comp_val, str) else str(comp_val)
-                if not comp_val:
-                    comp_val = "Unclassified"
-                counts[comp_val] = counts.get(comp_val, 0) + 1
+            counts = Counter(
+                comp_val.strip() or "Unclassified"
+                for comp_val in map(itemgetter(comp_idx), rows_filtered)
+            )
 
         if not counts:
             ttk.Label(keyword_chart_body, text="No data to chart.").pack(anchor="nw")
             return
 
         if keyword_vehicle_chart_var.get():
-            items = [(vehicle, counts.get(vehicle, 0)) for vehicle in counts.keys()]
-            shown = items
+            shown = list(counts.items())
         else:
-            items = sorted(counts.items(), key=lambda item: item[1], reverse=True)
             max_items = 20
-            shown = items[:max_items]
+            shown = heapq.nlargest(max_items, counts.items(), key=itemgetter(1))
         labels = [item[0] for item in shown]
         values = [item[1] for item in shown]
 
-        fig = Figure(figsize=(7.2, 3.2), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, ax, canvas = chart_figure(keyword_chart_body, (7.2, 3.2))
         x_vals = list(range(len(labels)))
         ax.bar(x_vals, values, width=0.8, color="#5b8def", edgecolor="#2f5fb3")
         ax.set_xticks(x_vals)
         ax.set_xticklabels(labels, rotation=45, ha="right")
         ax.set_ylabel("Count")
         title = f"{label_kind} counts (keyword filter)"
-        if not keyword_vehicle_chart_var.get() and len(items) > max_items:
-            title += f" - top {max_items} of {len(items)}"
+        if not keyword_vehicle_chart_var.get() and len(counts) > max_items:
+            title += f" - top {max_items} of {len(counts)}"
         ax.set_title(title)
         keyword_chart_frame.configure(text=f"{label_kind} bar chart (keyword filter)")
 
-        canvas = FigureCanvasTkAgg(fig, master=keyword_chart_body)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        show_chart_canvas(canvas)
 
     def find_header_index(target: str) -> int | None:
         """Find header index ignoring case and surrounding spaces."""
-        normalized = target.strip().lower()
-        for idx, name in enumerate(current_headers):
-            if name.strip().lower() == normalized:
-                return idx
-        return None
-
-    def parse_date(value: str) -> datetime | None:
-        """Parse common date formats; return None if invalid."""
-        if not value:
-            return None
-        value = value.strip()
-        formats = [
-            "%m/%d/%Y",
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%m/%d/%Y %H:%M",
-            "%m/%d/%Y %H:%M:%S",
-            "%m/%d/%Y %I:%M %p",
-            "%m/%d/%Y %I:%M:%S %p",
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-        ]
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt)
-            except ValueError:
-                continue
-        return None
+        return header_index_map.get(target.strip().lower())
 
     def build_unreadable_summary() -> str:
         start_idx = find_header_index("Start time")
@@ -2852,7 +3092,7 @@ def build_ui() -> None:
         total_rows = len(current_rows)
         invalid_rows = 0
         for row in current_rows:
-            value = row[start_idx] if start_idx < len(row) else ""
+            value = row[start_idx]
             if not value or parse_date(value) is None:
                 invalid_rows += 1
         return f" | Start time unreadable: {invalid_rows}/{total_rows}"
@@ -2878,7 +3118,7 @@ def build_ui() -> None:
 
     def sort_filter_values(values: list[str]) -> list[str]:
         def sort_key(value: str) -> tuple[int, int, str]:
-            digits = re.sub(r"\D", "", value)
+            digits = _NON_DIGIT_RE.sub("", value)
             if digits:
                 return (0, int(digits), value.lower())
             return (1, 0, value.lower())
@@ -2905,11 +3145,11 @@ def build_ui() -> None:
 
     def save_filters() -> None:
         state = {
-            "apm": {val for val, var in selected_apm_vars.items() if var.get()},
-            "trailer": {val for val, var in selected_trailer_vars.items() if var.get()},
-            "work_type": {val for val, var in selected_work_type_vars.items() if var.get()},
-            "hw_sw": {val for val, var in selected_hw_sw_vars.items() if var.get()},
-            "icr": {val for val, var in selected_icr_vars.items() if var.get()},
+            "apm": set(checked_apm_ids),
+            "trailer": set(checked_trailer_ids),
+            "work_type": set(checked_work_types),
+            "hw_sw": set(checked_hw_sw),
+            "icr": set(checked_icr),
             "accident": {current_accident_mode()},
         }
         size_text = f"{root.winfo_width()}x{root.winfo_height()}"
@@ -2923,7 +3163,7 @@ def build_ui() -> None:
         saved_filter_state = state
         saved_filters_applied = True
         status_var.set("Filter settings saved")
-        status_label.configure(foreground="green")
+        set_status_color("green")
 
     def reset_filters() -> None:
         for var in selected_apm_vars.values():
@@ -2949,113 +3189,191 @@ def build_ui() -> None:
         saved_filters_applied = True
         on_filter_change()
         status_var.set("Filters reset")
-        status_label.configure(foreground="green")
+        set_status_color("green")
+
+    def add_filter_var(
+        vars_by_value: dict[str, tk.BooleanVar], checked: set[str], value: str, initial: bool
+    ) -> tk.BooleanVar:
+        """Create a filter option's BooleanVar and keep `checked` in step with it."""
+        var = tk.BooleanVar(value=initial)
+        if initial:
+            checked.add(value)
+        bump_filter_version()
+
+        def sync(*_args) -> None:
+            if var.get():
+                checked.add(value)
+            else:
+                checked.discard(value)
+            bump_filter_version()
+
+        filter_var_traces[str(var)] = var.trace_add("write", sync)
+        vars_by_value[value] = var
+        return var
+
+    def drop_filter_var(vars_by_value: dict[str, tk.BooleanVar], value: str) -> None:
+        """Forget a filter option's BooleanVar, removing its trace so both can be freed."""
+        var = vars_by_value.pop(value)
+        cbname = filter_var_traces.pop(str(var), None)
+        if cbname is not None:
+            var.trace_remove("write", cbname)
+
+    def hide_filter_slots(target_inner: ttk.Frame, start: int = 0) -> None:
+        """Hide a filter frame's pooled checkbuttons from slot `start` on."""
+        key = str(target_inner)
+        pool = filter_checkbutton_pool.get(key, [])
+        shown = filter_slot_shown.get(key, [])
+        hidden: list[str] = []
+        for slot in range(start, len(pool)):
+            if shown[slot] is not None:
+                hidden.append(pool[slot]._w)
+                shown[slot] = None
+        if hidden:
+            target_inner.tk.call("grid", "remove", *hidden)
+
+    def place_filter_checkbutton(
+        target_inner: ttk.Frame, slot: int, text: str, var: tk.BooleanVar, row: int, column: int
+    ) -> None:
+        """Show the slot-th pooled checkbutton of a filter frame, creating it if needed."""
+        key = str(target_inner)
+        pool = filter_checkbutton_pool.setdefault(key, [])
+        shown = filter_slot_shown.setdefault(key, [])
+        placement = (text, str(var), row, column)
+        if slot < len(pool):
+            if shown[slot] == placement:
+                return
+            check = pool[slot]
+            check.configure(text=text, variable=var)
+        else:
+            check = ttk.Checkbutton(
+                target_inner,
+                text=text,
+                variable=var,
+                command=on_filter_change,
+            )
+            pool.append(check)
+            shown.append(None)
+        # Straight to Tcl: grid() would rebuild the option list on every call.
+        check.tk.call(
+            "grid", "configure", check._w,
+            "-row", row, "-column", column, "-sticky", "w", "-padx", 4, "-pady", 2,
+        )
+        shown[slot] = placement
+
+    def update_filter_options(
+        targets: list[tuple[ttk.Frame, tk.Canvas]],
+        values: list[str],
+        vars_by_value: dict[str, tk.BooleanVar],
+        checked: set[str],
+        all_values: list[str],
+        saved: set[str] | None,
+        position: Callable[[int], tuple[int, int]],
+    ) -> None:
+        """
+        Show `values` as checkbuttons in every target frame.
+
+        Options that were already listed keep their BooleanVar and widget, so a
+        rebuild only creates, moves or hides what actually changed.
+        """
+        previous_selected = set(checked)
+        keep = set(values)
+        for value in [v for v in vars_by_value if v not in keep]:
+            drop_filter_var(vars_by_value, value)
+            checked.discard(value)
+        bump_filter_version()
+        all_values[:] = values
+        for value in values:
+            if saved is not None:
+                initial = value in saved
+            else:
+                initial = value in previous_selected or not previous_selected
+            var = vars_by_value.get(value)
+            if var is None:
+                add_filter_var(vars_by_value, checked, value, initial)
+            elif var.get() != initial:
+                var.set(initial)
+        for target_inner, target_canvas in targets:
+            note = filter_frame_notes.pop(str(target_inner), None)
+            if note is not None:
+                note.destroy()
+            for idx, value in enumerate(values):
+                place_filter_checkbutton(
+                    target_inner, idx, value, vars_by_value[value], *position(idx)
+                )
+            hide_filter_slots(target_inner, len(values))
+            target_canvas.yview_moveto(0)
+
+    def show_missing_filter_column(
+        targets: list[tuple[ttk.Frame, tk.Canvas]],
+        vars_by_value: dict[str, tk.BooleanVar],
+        checked: set[str],
+        all_values: list[str],
+        column_name: str,
+    ) -> None:
+        for value in list(vars_by_value):
+            drop_filter_var(vars_by_value, value)
+        checked.clear()
+        bump_filter_version()
+        all_values.clear()
+        for target_inner, _ in targets:
+            hide_filter_slots(target_inner)
+            if str(target_inner) not in filter_frame_notes:
+                note = ttk.Label(target_inner, text=f"No {column_name} column found")
+                note.pack(anchor="w")
+                filter_frame_notes[str(target_inner)] = note
+
+    def saved_filter_values(key: str) -> set[str] | None:
+        if not saved_filters_applied and key in saved_filter_state:
+            return saved_filter_state[key]
+        return None
 
     def refresh_apm_filter_options() -> None:
-        previous_selected = {vid for vid, var in selected_apm_vars.items() if var.get()}
         apm_targets: list[tuple[ttk.Frame, tk.Canvas]] = [
             (apm_list_inner, apm_list_canvas),
             (model_apm_list_inner, model_apm_list_canvas),
         ]
-        for target_inner, _ in apm_targets:
-            for child in target_inner.winfo_children():
-                child.destroy()
-        selected_apm_vars.clear()
-        all_apm_ids.clear()
         apm_idx = find_header_index("APM")
         if apm_idx is None:
-            for target_inner, _ in apm_targets:
-                ttk.Label(target_inner, text="No APM column found").pack(anchor="w")
+            show_missing_filter_column(
+                apm_targets, selected_apm_vars, checked_apm_ids, all_apm_ids, "APM"
+            )
             return
 
-        ids_seen: list[str] = []
-        for row in current_rows:
-            apm_val = row[apm_idx] if apm_idx < len(row) else ""
-            if not apm_val:
-                continue
-            if apm_val not in ids_seen:
-                ids_seen.append(apm_val)
-
-        filtered_ids = ids_seen
-        filtered_ids = sort_filter_values(filtered_ids)
+        ids_seen = list(dict.fromkeys(row[apm_idx] for row in current_rows if row[apm_idx]))
         rows_per_col = 5
-        use_saved = (not saved_filters_applied) and "apm" in saved_filter_state
-        for idx, apm_id in enumerate(filtered_ids):
-            all_apm_ids.append(apm_id)
-            if use_saved:
-                var = tk.BooleanVar(value=apm_id in saved_filter_state["apm"])
-            else:
-                var = tk.BooleanVar(value=apm_id in previous_selected or not previous_selected)
-            selected_apm_vars[apm_id] = var
-            for target_inner, _ in apm_targets:
-                ttk.Checkbutton(
-                    target_inner,
-                    text=apm_id,
-                    variable=var,
-                    command=on_filter_change,
-                ).grid(
-                    row=idx % rows_per_col,
-                    column=idx // rows_per_col,
-                    sticky="w",
-                    padx=4,
-                    pady=2,
-                )
-
-        for _, target_canvas in apm_targets:
-            target_canvas.yview_moveto(0)
+        update_filter_options(
+            apm_targets,
+            sort_filter_values(ids_seen),
+            selected_apm_vars,
+            checked_apm_ids,
+            all_apm_ids,
+            saved_filter_values("apm"),
+            lambda idx: (idx % rows_per_col, idx // rows_per_col),
+        )
 
     def refresh_trailer_filter_options() -> None:
-        previous_selected = {vid for vid, var in selected_trailer_vars.items() if var.get()}
         trailer_targets: list[tuple[ttk.Frame, tk.Canvas]] = [
             (trailer_list_inner, trailer_list_canvas),
             (model_trailer_list_inner, model_trailer_list_canvas),
         ]
-        for target_inner, _ in trailer_targets:
-            for child in target_inner.winfo_children():
-                child.destroy()
-        selected_trailer_vars.clear()
-        all_trailer_ids.clear()
         trailer_idx = find_header_index("Trailer")
         if trailer_idx is None:
-            for target_inner, _ in trailer_targets:
-                ttk.Label(target_inner, text="No Trailer column found").pack(anchor="w")
+            show_missing_filter_column(
+                trailer_targets, selected_trailer_vars, checked_trailer_ids, all_trailer_ids, "Trailer"
+            )
             return
 
-        ids_seen: list[str] = []
-        for row in current_rows:
-            trailer_val = row[trailer_idx] if trailer_idx < len(row) else ""
-            if not trailer_val:
-                continue
-            if trailer_val not in ids_seen:
-                ids_seen.append(trailer_val)
-
-        filtered_ids = ids_seen
-        filtered_ids = sort_filter_values(filtered_ids)
+        ids_seen = list(dict.fromkeys(row[trailer_idx] for row in current_rows if row[trailer_idx]))
         rows_per_col = 5
-        use_saved = (not saved_filters_applied) and "trailer" in saved_filter_state
-        for idx, trailer_id in enumerate(filtered_ids):
-            all_trailer_ids.append(trailer_id)
-            if use_saved:
-                var = tk.BooleanVar(value=trailer_id in saved_filter_state["trailer"])
-            else:
-                var = tk.BooleanVar(value=trailer_id in previous_selected or not previous_selected)
-            selected_trailer_vars[trailer_id] = var
-            for target_inner, _ in trailer_targets:
-                ttk.Checkbutton(
-                    target_inner,
-                    text=trailer_id,
-                    variable=var,
-                    command=on_filter_change,
-                ).grid(
-                    row=idx % rows_per_col,
-                    column=idx // rows_per_col,
-                    sticky="w",
-                    padx=4,
-                    pady=2,
-                )
-
-        for _, target_canvas in trailer_targets:
-            target_canvas.yview_moveto(0)
+        update_filter_options(
+            trailer_targets,
+            sort_filter_values(ids_seen),
+            selected_trailer_vars,
+            checked_trailer_ids,
+            all_trailer_ids,
+            saved_filter_values("trailer"),
+            lambda idx: (idx % rows_per_col, idx // rows_per_col),
+        )
 
     def select_all_apm(state: bool) -> None:
         for var in selected_apm_vars.values():
@@ -3070,162 +3388,220 @@ def build_ui() -> None:
         build_model_counts()
 
     def refresh_work_type_filter_options() -> None:
-        previous_selected = {
-            val for val, var in selected_work_type_vars.items() if var.get()
-        }
         work_type_targets: list[tuple[ttk.Frame, tk.Canvas]] = [
             (work_type_list_inner, work_type_list_canvas),
             (model_work_type_list_inner, model_work_type_list_canvas),
         ]
-        for target_inner, _ in work_type_targets:
-            for child in target_inner.winfo_children():
-                child.destroy()
-        selected_work_type_vars.clear()
-        all_work_types.clear()
         field_idx = find_header_index("Work type")
         if field_idx is None:
-            for target_inner, _ in work_type_targets:
-                ttk.Label(target_inner, text="No Work type column found").pack(anchor="w")
+            show_missing_filter_column(
+                work_type_targets, selected_work_type_vars, checked_work_types, all_work_types, "Work type"
+            )
             return
 
-        values_seen: list[str] = []
-        for row in current_rows:
-            value = row[field_idx] if field_idx < len(row) else ""
-            if not value:
-                continue
-            if value not in values_seen:
-                values_seen.append(value)
-
-        filtered_values = values_seen
-        use_saved = (not saved_filters_applied) and "work_type" in saved_filter_state
-        for idx, value in enumerate(filtered_values):
-            all_work_types.append(value)
-            if use_saved:
-                var = tk.BooleanVar(value=value in saved_filter_state["work_type"])
-            else:
-                var = tk.BooleanVar(value=value in previous_selected or not previous_selected)
-            selected_work_type_vars[value] = var
-            for target_inner, _ in work_type_targets:
-                ttk.Checkbutton(
-                    target_inner,
-                    text=value,
-                    variable=var,
-                    command=on_filter_change,
-                ).grid(
-                    row=idx // 4, column=idx % 4, sticky="w", padx=4, pady=2
-                )
-        for _, target_canvas in work_type_targets:
-            target_canvas.yview_moveto(0)
+        values_seen = list(dict.fromkeys(row[field_idx] for row in current_rows if row[field_idx]))
+        update_filter_options(
+            work_type_targets,
+            values_seen,
+            selected_work_type_vars,
+            checked_work_types,
+            all_work_types,
+            saved_filter_values("work_type"),
+            lambda idx: (idx // 4, idx % 4),
+        )
 
     def refresh_hw_sw_filter_options() -> None:
-        previous_selected = {
-            val for val, var in selected_hw_sw_vars.items() if var.get()
-        }
         hw_sw_targets: list[tuple[ttk.Frame, tk.Canvas]] = [
             (hw_sw_list_inner, hw_sw_list_canvas),
             (model_hw_sw_list_inner, model_hw_sw_list_canvas),
         ]
-        for target_inner, _ in hw_sw_targets:
-            for child in target_inner.winfo_children():
-                child.destroy()
-        selected_hw_sw_vars.clear()
-        all_hw_sw_types.clear()
         field_idx = find_header_index("Hardware/Software")
         if field_idx is None:
-            for target_inner, _ in hw_sw_targets:
-                ttk.Label(target_inner, text="No Hardware/Software column found").pack(anchor="w")
+            show_missing_filter_column(
+                hw_sw_targets, selected_hw_sw_vars, checked_hw_sw, all_hw_sw_types, "Hardware/Software"
+            )
             return
 
-        values_seen: list[str] = []
-        for row in current_rows:
-            value = row[field_idx] if field_idx < len(row) else ""
-            if not value:
-                continue
-            if value not in values_seen:
-                values_seen.append(value)
-
-        filtered_values = values_seen
-        use_saved = (not saved_filters_applied) and "hw_sw" in saved_filter_state
-        for idx, value in enumerate(filtered_values):
-            all_hw_sw_types.append(value)
-            if use_saved:
-                var = tk.BooleanVar(value=value in saved_filter_state["hw_sw"])
-            else:
-                var = tk.BooleanVar(value=value in previous_selected or not previous_selected)
-            selected_hw_sw_vars[value] = var
-            for target_inner, _ in hw_sw_targets:
-                ttk.Checkbutton(
-                    target_inner,
-                    text=value,
-                    variable=var,
-                    command=on_filter_change,
-                ).grid(
-                    row=idx // 4, column=idx % 4, sticky="w", padx=4, pady=2
-                )
-        for _, target_canvas in hw_sw_targets:
-            target_canvas.yview_moveto(0)
+        values_seen = list(dict.fromkeys(row[field_idx] for row in current_rows if row[field_idx]))
+        update_filter_options(
+            hw_sw_targets,
+            values_seen,
+            selected_hw_sw_vars,
+            checked_hw_sw,
+            all_hw_sw_types,
+            saved_filter_values("hw_sw"),
+            lambda idx: (idx // 4, idx % 4),
+        )
 
     def refresh_icr_filter_options() -> None:
-        previous_selected = {
-            val for val, var in selected_icr_vars.items() if var.get()
-        }
         icr_targets: list[tuple[ttk.Frame, tk.Canvas]] = [
             (icr_list_inner, icr_list_canvas),
             (model_icr_list_inner, model_icr_list_canvas),
         ]
-        for target_inner, _ in icr_targets:
-            for child in target_inner.winfo_children():
-                child.destroy()
-        selected_icr_vars.clear()
-        all_icr_types.clear()
         field_idx = find_header_index("Inspection/Change/Rework")
         if field_idx is None:
-            for target_inner, _ in icr_targets:
-                ttk.Label(target_inner, text="No Inspection/Change/Rework column found").pack(anchor="w")
+            show_missing_filter_column(
+                icr_targets, selected_icr_vars, checked_icr, all_icr_types, "Inspection/Change/Rework"
+            )
             return
 
-        values_seen: list[str] = []
-        for row in current_rows:
-            value = row[field_idx] if field_idx < len(row) else ""
-            if not value:
-                continue
-            if value not in values_seen:
-                values_seen.append(value)
-
-        filtered_values = values_seen
-        use_saved = (not saved_filters_applied) and "icr" in saved_filter_state
-        for idx, value in enumerate(filtered_values):
-            all_icr_types.append(value)
-            if use_saved:
-                var = tk.BooleanVar(value=value in saved_filter_state["icr"])
-            else:
-                var = tk.BooleanVar(value=value in previous_selected or not previous_selected)
-            selected_icr_vars[value] = var
-            for target_inner, _ in icr_targets:
-                ttk.Checkbutton(
-                    target_inner,
-                    text=value,
-                    variable=var,
-                    command=on_filter_change,
-                ).grid(
-                    row=idx // 4, column=idx % 4, sticky="w", padx=4, pady=2
+        values_seen = list(dict.fromkeys(row[field_idx] for row in current_rows if row[field_idx]))
+        update_filter_options(
+            icr_targets,
+            values_seen,
+            selected_icr_vars,
+            checked_icr,
+            all_icr_types,
+            saved_filter_values("icr"),
+            lambda idx: (idx // 4, idx % 4),
+        )
+
+
+    def filter_signature() -> tuple:
+        """Snapshot the current filter selections, for keying derived-row caches."""
+        cached = filter_signature_cache.get(filter_version)
+        if cached is None:
+            filter_signature_cache.clear()
+            cached = filter_signature_cache[filter_version] = compute_filter_signature()
+        return cached
+
+    def compute_filter_signature() -> tuple:
+        return (
+            current_accident_mode(),
+            tuple(
+                (bool(vars_by_value), frozenset(checked))
+                for vars_by_value, checked in (
+                    (selected_apm_vars, checked_apm_ids),
+                    (selected_trailer_vars, checked_trailer_ids),
+                    (selected_work_type_vars, checked_work_types),
+                    (selected_hw_sw_vars, checked_hw_sw),
+                    (selected_icr_vars, checked_icr),
                 )
-        for _, target_canvas in icr_targets:
-            target_canvas.yview_moveto(0)
+            ),
+        )
 
+    def filter_column_codes(idx: int) -> tuple[dict[str, int], np.ndarray]:
+        """Integer-code a column by first appearance: (value -> code, code per row)."""
+        codes = filter_column_cache.get(("codes", idx))
+        if codes is None:
+            code_of = filter_category_codes[idx] = {}
+            codes = filter_column_cache[("codes", idx)] = np.fromiter(
+                (code_of.setdefault(row[idx], len(code_of)) for row in current_rows),
+                dtype=np.intp,
+                count=len(current_rows),
+            )
+        return filter_category_codes[idx], codes
+
+    def accident_flags(idx: int) -> np.ndarray:
+        flags = filter_column_cache.get(("accident", idx))
+        if flags is None:
+            flags = filter_column_cache[("accident", idx)] = np.fromiter(
+                (normalize_accident(row[idx]) == "Yes" for row in current_rows),
+                dtype=bool,
+                count=len(current_rows),
+            )
+        return flags
+
+    def filtered_rows_and_indexes() -> tuple[list[int], list[tuple[str, ...]]]:
+        signature = filter_signature()
+        cached = filtered_rows_cache.get(signature)
+        if cached is None:
+            filtered_rows_cache.clear()
+            indexes = compute_filtered_indexes()
+            cached = filtered_rows_cache[signature] = (
+                indexes,
+                [current_rows[i] for i in indexes],
+            )
+        return cached
+
+    def get_filtered_rows() -> list[tuple[str, ...]]:
+        return filtered_rows_and_indexes()[1]
+
+    def get_filtered_indexes() -> list[int]:
+        """Positions in current_rows of the rows get_filtered_rows() returns."""
+        return filtered_rows_and_indexes()[0]
 
-    def get_filtered_rows() -> list[list[str]]:
+    def period_key_column(period_kind: str, date_idx: int) -> list[str | None]:
+        column = period_key_columns.get(period_kind)
+        if column is None:
+            column = period_key_columns[period_kind] = [
+                None if labels is None else labels.get(period_kind, "Unknown")
+                for labels in map(period_labels_for, map(itemgetter(date_idx), current_rows))
+            ]
+        return column
+
+    def period_key_codes(period_kind: str, date_idx: int) -> tuple[list[str], np.ndarray]:
+        cached = period_code_columns.get(period_kind)
+        if cached is None:
+            code_of: dict[str, int] = {}
+            codes = np.fromiter(
+                (
+                    -1 if key is None else code_of.setdefault(key, len(code_of))
+                    for key in period_key_column(period_kind, date_idx)
+                ),
+                dtype=np.intp,
+                count=len(current_rows),
+            )
+            cached = period_code_columns[period_kind] = (list(code_of), codes)
+        return cached
+
+    def count_filtered_by_period(
+        label_idx: int, period_kind: str, date_idx: int | None
+    ) -> tuple[list[str], list[str], np.ndarray, int]:
+        """
+        Count filtered rows per (label column value, period) from the coded columns.
+
+        Returns:
+            labels in order of first appearance, chronologically sorted periods
+            (["Sum"] when none), the count matrix laid out by both, and the
+            number of rows skipped for an unparseable date.
+        """
+        positions = np.asarray(get_filtered_indexes(), dtype=np.intp)
+        code_of, label_codes = filter_column_codes(label_idx)
+        label_codes = label_codes[positions]
+        if period_kind == "all" or date_idx is None:
+            period_labels = ["Sum"]
+            period_codes = np.zeros(len(positions), dtype=np.intp)
+        else:
+            period_labels, period_codes = period_key_codes(period_kind, date_idx)
+            period_codes = period_codes[positions]
+        valid = period_codes >= 0
+        invalid_date_rows = len(positions) - int(np.count_nonzero(valid))
+
+        def first_seen(codes: np.ndarray) -> np.ndarray:
+            seen, first_pos = np.unique(codes, return_index=True)
+            return seen[np.argsort(first_pos)]
+
+        label_order = first_seen(label_codes)
+        label_names = list(code_of)
+        labels = [label_names[code] for code in label_order.tolist()]
+        period_seen = first_seen(period_codes[valid]).tolist()
+        if not period_seen:
+            return labels, ["Sum"], np.zeros((len(labels), 1), dtype=np.int64), invalid_date_rows
+
+        n_periods = len(period_labels)
+        counts = np.bincount(
+            label_codes[valid] * n_periods + period_codes[valid],
+            minlength=len(label_names) * n_periods,
+        ).reshape(len(label_names), n_periods)
+        period_order = sort_period_labels([period_labels[code] for code in period_seen])
+        period_code_of = {label: code for code, label in enumerate(period_labels)}
+        period_cols = [period_code_of[label] for label in period_order]
+        return labels, period_order, counts[np.ix_(label_order, period_cols)], invalid_date_rows
+
+    def compute_filtered_indexes() -> list[int]:
         apm_idx = find_header_index("APM")
         trailer_idx = find_header_index("Trailer")
         work_type_idx = find_header_index("Work type")
         hw_sw_idx = find_header_index("Hardware/Software")
         icr_idx = find_header_index("Inspection/Change/Rework")
+        acc_idx = find_header_index("Accident")
 
-        selected_apm_ids = [vid for vid, var in selected_apm_vars.items() if var.get()]
-        selected_trailer_ids = [vid for vid, var in selected_trailer_vars.items() if var.get()]
-        selected_work_types = [val for val, var in selected_work_type_vars.items() if var.get()]
-        selected_hw_sw = [val for val, var in selected_hw_sw_vars.items() if var.get()]
-        selected_icr = [val for val, var in selected_icr_vars.items() if var.get()]
+        selected_apm_ids = set(checked_apm_ids)
+        selected_trailer_ids = set(checked_trailer_ids)
+        selected_work_types = set(checked_work_types)
+        selected_hw_sw = set(checked_hw_sw)
+        selected_icr = set(checked_icr)
         accident_mode = current_accident_mode()
 
         if apm_idx is not None and selected_apm_vars and not selected_apm_ids:
@@ -3239,60 +3615,51 @@ def build_ui() -> None:
         if icr_idx is not None and selected_icr_vars and not selected_icr:
             return []
 
-        filtered: list[list[str]] = []
-        for row in current_rows:
-            if accident_mode != "all":
-                acc_idx = find_header_index("Accident")
-                acc_val = row[acc_idx] if acc_idx is not None and acc_idx < len(row) else ""
-                acc_val = acc_val.strip().lower() if isinstance(acc_val, str) else str(acc_val).lower()
-                is_accident = acc_val in {"yes", "y", "true", "1"}
-                if accident_mode == "yes" and not is_accident:
-                    continue
-                if accident_mode == "no" and is_accident:
-                    continue
-
-            if apm_idx is not None:
-                apm_val = row[apm_idx] if apm_idx < len(row) else ""
-                if selected_apm_ids and apm_val not in selected_apm_ids:
-                    continue
-            if trailer_idx is not None:
-                trailer_val = row[trailer_idx] if trailer_idx < len(row) else ""
-                if selected_trailer_ids and trailer_val not in selected_trailer_ids:
-                    continue
-
-            if work_type_idx is not None:
-                work_type_val = row[work_type_idx] if work_type_idx < len(row) else ""
-                if selected_work_types and work_type_val not in selected_work_types:
-                    continue
-
-            if hw_sw_idx is not None:
-                hw_sw_val = row[hw_sw_idx] if hw_sw_idx < len(row) else ""
-                if selected_hw_sw and hw_sw_val not in selected_hw_sw:
-                    continue
-
-            if icr_idx is not None:
-                icr_val = row[icr_idx] if icr_idx < len(row) else ""
-                if selected_icr and icr_val not in selected_icr:
+        if not current_rows:
+            return []
+        # One boolean mask over all rows; each active filter narrows it in numpy.
+        mask = np.ones(len(current_rows), dtype=bool)
+        if accident_mode != "all":
+            if acc_idx is None:
+                is_accident = np.zeros(len(current_rows), dtype=bool)
+            else:
+                is_accident = accident_flags(acc_idx)
+            mask &= is_accident if accident_mode == "yes" else ~is_accident
+        for field_idx, selected in (
+            (apm_idx, selected_apm_ids),
+            (trailer_idx, selected_trailer_ids),
+            (work_type_idx, selected_work_types),
+            (hw_sw_idx, selected_hw_sw),
+            (icr_idx, selected_icr),
+        ):
+            if field_idx is not None and selected:
+                code_of, codes = filter_column_codes(field_idx)
+                selected_codes = [code_of[value] for value in selected if value in code_of]
+                if len(selected_codes) == len(code_of):
+                    # Every category in the column is selected (the default),
+                    # so this filter cannot exclude any row.
                     continue
-
-            filtered.append(row)
-        return filtered
+                # Selected-category lookup table, gathered by each row's code.
+                selected_lut = np.zeros(len(code_of), dtype=bool)
+                selected_lut[selected_codes] = True
+                mask &= selected_lut[codes]
+        return np.flatnonzero(mask).tolist()
 
     def build_fleet_counts() -> None:
         """Builds a component count table grouped by period."""
         required_fields = ["Component"]
         if not current_headers:
             status_var.set("Load a CSV before building fleet counts")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_fleet_table()
             clear_apm_table()
             return
-        missing = [field for field in required_fields if field not in current_headers]
+        missing = [field for field in required_fields if find_header_index(field) is None]
         if missing:
             status_var.set(
                 f"Missing columns for fleet counts: {', '.join(missing)}"
             )
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_fleet_table()
             clear_apm_table()
             return
@@ -3300,141 +3667,43 @@ def build_ui() -> None:
         date_idx = find_header_index("Start time")
         if alert_idx is None:
             status_var.set("Could not find 'Component' column")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_fleet_table()
             clear_apm_table()
             return
         if date_idx is None and fleet_period_var.get() != "all":
             status_var.set("Start time column not found; cannot group by time")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_fleet_table()
             clear_apm_table()
             return
 
-        alert_order: list[str] = []
-        period_order: list[str] = []
-        alert_totals: dict[str, dict[str, int]] = {}
-        invalid_date_rows = 0
-
-        def remember(value: str, collection: list[str]) -> None:
-            if value not in collection:
-                collection.append(value)
-
         rows_source = get_filtered_rows()
         if not rows_source:
             status_var.set("No data after filters")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_fleet_table()
             clear_apm_table()
             return
 
-        for row in rows_source:
-            alert_val = row[alert_idx] if alert_idx < len(row) else ""
-            remember(alert_val, alert_order)
-
-            if fleet_period_var.get() == "all":
-                period_key = "Sum"
-            else:
-                date_val = row[date_idx] if date_idx < len(row) else ""
-                dt = parse_date(date_val)
-                if dt:
-                    if fleet_period_var.get() == "day":
-                        period_key = dt.strftime("%Y-%m-%d")
-                    elif fleet_period_var.get() == "week":
-                        iso_year, iso_week, _ = dt.isocalendar()
-                        period_key = f"{iso_year}-W{iso_week:02d}"
-                    elif fleet_period_var.get() == "month":
-                        period_key = dt.strftime("%Y-%m")
-                    elif fleet_period_var.get() == "quarter":
-                        q = (dt.month - 1) // 3 + 1
-                        period_key = f"{dt.year}-Q{q}"
-                    else:
-                        period_key = "Unknown"
-                else:
-                    invalid_date_rows += 1
-                    continue
-            remember(period_key, period_order)
-
-            alert_totals.setdefault(alert_val, {})
-            alert_totals[alert_val][period_key] = (
-                alert_totals[alert_val].get(period_key, 0) + 1
-            )
-
-        if not period_order:
-            period_order = ["Sum"]
-        else:
-            period_order = sort_period_labels(period_order)
+        period_kind = fleet_period_var.get()
+        alert_order, period_order, alert_matrix, invalid_date_rows = count_filtered_by_period(
+            alert_idx, period_kind, date_idx
+        )
 
         headers = ["Component"] + period_order
         fleet_rows: list[list[str]] = []
 
-        def add_meta_rows_from_dates(date_list: list[datetime | None]) -> None:
-            years: list[str] = []
-            months: list[str] = []
-            days: list[str] = []
-            weeks: list[str] = []
-            quarters: list[str] = []
-            for dt in date_list:
-                if dt is None:
-                    years.append("")
-                    months.append("")
-                    days.append("")
-                    weeks.append("")
-                    quarters.append("")
-                    continue
-                years.append(str(dt.year))
-                months.append(f"{dt.month:02d}")
-                days.append(f"{dt.day:02d}")
-                iso_year, iso_week, _ = dt.isocalendar()
-                weeks.append(f"{iso_week:02d}")
-                q = (dt.month - 1) // 3 + 1
-                quarters.append(str(q))
-            fleet_rows.extend(
-                [
-                    ["YEAR"] + years,
-                    ["MONTH"] + months,
-                    ["DAY"] + days,
-                    ["WEEK"] + weeks,
-                    ["QUARTER"] + quarters,
-                ]
-            )
+        if period_kind in _PERIOD_FORMATTERS:
+            fleet_rows.extend(period_meta_rows(period_order))
 
-        if fleet_period_var.get() in {"day", "week", "month", "quarter"}:
-            parsed_dates: list[datetime | None] = []
-            for period in period_order:
-                dt: datetime | None = None
-                try:
-                    if fleet_period_var.get() == "day":
-                        dt = datetime.strptime(period, "%Y-%m-%d")
-                    elif fleet_period_var.get() == "week":
-                        m = re.match(r"^(\d{4})-W(\d{2})$", period)
-                        if m:
-                            year, week = int(m.group(1)), int(m.group(2))
-                            dt = datetime.strptime(f"{year}-W{week}-1", "%G-W%V-%u")
-                    elif fleet_period_var.get() == "month":
-                        dt = datetime.strptime(period, "%Y-%m")
-                    elif fleet_period_var.get() == "quarter":
-                        m = re.match(r"^(\d{4})-Q(\d)$", period)
-                        if m:
-                            year, quarter = int(m.group(1)), int(m.group(2))
-                            month = (quarter - 1) * 3 + 1
-                            dt = datetime(year, month, 1)
-                except ValueError:
-                    dt = None
-                parsed_dates.append(dt)
-            add_meta_rows_from_dates(parsed_dates)
-
-        def total_for_alert(alert_val: str) -> int:
-            counts_for_alert = alert_totals.get(alert_val, {})
-            return sum(counts_for_alert.get(period, 0) for period in period_order)
-
-        alert_order.sort(key=total_for_alert, reverse=True)
-
-        for alert_val in alert_order:
-            counts_for_alert = alert_totals.get(alert_val, {})
-            fleet_rows.append(
-                [alert_val] + [str(counts_for_alert.get(period, 0)) for period in period_order]
-            )
+        # Busiest components first; the stable sort keeps first-seen order on ties.
+        by_total = np.argsort(-alert_matrix.sum(axis=1), kind="stable")
+        alert_order = [alert_order[pos] for pos in by_total.tolist()]
+        fleet_rows.extend(
+            [alert_val] + cells
+            for alert_val, cells in zip(alert_order, alert_matrix[by_total].astype(str).tolist())
+        )
 
         populate_fleet_table(headers, fleet_rows)
 
@@ -3444,26 +3713,24 @@ def build_ui() -> None:
         if apm_idx is not None or trailer_idx is not None:
             apm_headers = ["Component"]
             apm_rows: list[list[str]] = []
-            # Keep consistent vehicle order based on data appearance
-            vehicle_order: list[str] = []
-            apm_counts: dict[str, dict[str, int]] = {}
-            for row in rows_source:
-                alert_val = row[alert_idx] if alert_idx < len(row) else ""
-                apm_val = row[apm_idx] if apm_idx is not None and apm_idx < len(row) else ""
-                trailer_val = row[trailer_idx] if trailer_idx is not None and trailer_idx < len(row) else ""
-                vehicle_val = " / ".join([val for val in [apm_val, trailer_val] if val])
+            # Count distinct (component, APM, trailer) cells in C, then label
+            # each combination once; Counter keeps first-appearance order, so
+            # vehicles still follow the data.
+            key_idxs = [alert_idx] + [idx for idx in (apm_idx, trailer_idx) if idx is not None]
+            cell_counts = Counter(map(itemgetter(*key_idxs), rows_source))
+            vehicle_order: dict[str, None] = {}
+            apm_counts: Counter[tuple[str, str]] = Counter()
+            for (alert_val, *vehicle_cells), count in cell_counts.items():
+                vehicle_val = " / ".join(filter(None, vehicle_cells))
                 if not vehicle_val:
                     continue
-                if vehicle_val not in vehicle_order:
-                    vehicle_order.append(vehicle_val)
-                apm_counts.setdefault(alert_val, {})
-                apm_counts[alert_val][vehicle_val] = apm_counts[alert_val].get(vehicle_val, 0) + 1
+                vehicle_order.setdefault(vehicle_val)
+                apm_counts[alert_val, vehicle_val] += count
             apm_headers += vehicle_order
-            for alert_val in alert_order:
-                row_counts = apm_counts.get(alert_val, {})
-                apm_rows.append(
-                    [alert_val] + [str(row_counts.get(v, 0)) for v in vehicle_order]
-                )
+            apm_rows.extend(
+                [alert_val, *(str(apm_counts[alert_val, vehicle]) for vehicle in vehicle_order)]
+                for alert_val in alert_order
+            )
             populate_apm_table(apm_headers, apm_rows)
         else:
             clear_apm_table()
@@ -3474,164 +3741,74 @@ def build_ui() -> None:
         if invalid_date_rows and fleet_period_var.get() != "all":
             status_msg += f"; skipped {invalid_date_rows} invalid Start time row(s)"
         status_var.set(status_msg)
-        status_label.configure(foreground="green")
+        set_status_color("green")
 
     def build_model_counts() -> None:
         """Builds a model count table grouped by period."""
         required_fields = ["Model"]
         if not current_headers:
             status_var.set("Load a CSV before building model counts")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_model_table()
             return
-        missing = [field for field in required_fields if field not in current_headers]
+        missing = [field for field in required_fields if find_header_index(field) is None]
         if missing:
             status_var.set(
                 f"Missing columns for model counts: {', '.join(missing)}"
             )
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_model_table()
             return
         model_idx = find_header_index("Model")
         date_idx = find_header_index("Start time")
         if model_idx is None:
             status_var.set("Could not find 'Model' column")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_model_table()
             return
         if date_idx is None and model_period_var.get() != "all":
             status_var.set("Start time column not found; cannot group by time")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_model_table()
             return
 
-        model_order: list[str] = []
-        period_order: list[str] = []
-        model_totals: dict[str, dict[str, int]] = {}
-        invalid_date_rows = 0
-
-        def remember(value: str, collection: list[str]) -> None:
-            if value not in collection:
-                collection.append(value)
-
-        rows_source = get_filtered_rows()
-        if not rows_source:
+        if not get_filtered_indexes():
             status_var.set("No data after filters")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             clear_model_table()
             return
 
-        for row in rows_source:
-            model_val = row[model_idx] if model_idx < len(row) else ""
-            remember(model_val, model_order)
-
-            if model_period_var.get() == "all":
-                period_key = "Sum"
-            else:
-                date_val = row[date_idx] if date_idx < len(row) else ""
-                dt = parse_date(date_val)
-                if dt:
-                    if model_period_var.get() == "day":
-                        period_key = dt.strftime("%Y-%m-%d")
-                    elif model_period_var.get() == "week":
-                        iso_year, iso_week, _ = dt.isocalendar()
-                        period_key = f"{iso_year}-W{iso_week:02d}"
-                    elif model_period_var.get() == "month":
-                        period_key = dt.strftime("%Y-%m")
-                    elif model_period_var.get() == "quarter":
-                        q = (dt.month - 1) // 3 + 1
-                        period_key = f"{dt.year}-Q{q}"
-                    else:
-                        period_key = "Unknown"
-                else:
-                    invalid_date_rows += 1
-                    continue
-            remember(period_key, period_order)
-
-            model_totals.setdefault(model_val, {})
-            model_totals[model_val][period_key] = (
-                model_totals[model_val].get(period_key, 0) + 1
+        period_kind = model_period_var.get()
+        build_key = (filter_signature(), period_kind, model_idx, date_idx)
+        invalid_date_rows = model_invalid_date_rows.get(build_key)
+        if table_build_keys.get("model") != build_key or invalid_date_rows is None:
+            model_order, period_order, model_matrix, invalid_date_rows = count_filtered_by_period(
+                model_idx, period_kind, date_idx
             )
 
-        if not period_order:
-            period_order = ["Sum"]
-        else:
-            period_order = sort_period_labels(period_order)
+            headers = ["Model"] + period_order
+            model_rows: list[list[str]] = []
 
-        headers = ["Model"] + period_order
-        model_rows: list[list[str]] = []
-
-        def add_meta_rows_from_dates(date_list: list[datetime | None]) -> None:
-            years: list[str] = []
-            months: list[str] = []
-            days: list[str] = []
-            weeks: list[str] = []
-            quarters: list[str] = []
-            for dt in date_list:
-                if dt is None:
-                    years.append("")
-                    months.append("")
-                    days.append("")
-                    weeks.append("")
-                    quarters.append("")
-                    continue
-                years.append(str(dt.year))
-                months.append(f"{dt.month:02d}")
-                days.append(f"{dt.day:02d}")
-                iso_year, iso_week, _ = dt.isocalendar()
-                weeks.append(f"{iso_week:02d}")
-                q = (dt.month - 1) // 3 + 1
-                quarters.append(str(q))
-            model_rows.extend(
-                [
-                    ["YEAR"] + years,
-                    ["MONTH"] + months,
-                    ["DAY"] + days,
-                    ["WEEK"] + weeks,
-                    ["QUARTER"] + quarters,
-                ]
-            )
+            if period_kind in _PERIOD_FORMATTERS:
+                model_rows.extend(period_meta_rows(period_order))
 
-        if model_period_var.get() in {"day", "week", "month", "quarter"}:
-            parsed_dates: list[datetime | None] = []
-            for period in period_order:
-                dt: datetime | None = None
-                try:
-                    if model_period_var.get() == "day":
-                        dt = datetime.strptime(period, "%Y-%m-%d")
-                    elif model_period_var.get() == "week":
-                        m = re.match(r"^(\d{4})-W(\d{2})$", period)
-                        if m:
-                            year, week = int(m.group(1)), int(m.group(2))
-                            dt = datetime.strptime(f"{year}-W{week}-1", "%G-W%V-%u")
-                    elif model_period_var.get() == "month":
-                        dt = datetime.strptime(period, "%Y-%m")
-                    elif model_period_var.get() == "quarter":
-                        m = re.match(r"^(\d{4})-Q(\d)$", period)
-                        if m:
-                            year, quarter = int(m.group(1)), int(m.group(2))
-                            month = (quarter - 1) * 3 + 1
-                            dt = datetime(year, month, 1)
-                except ValueError:
-                    dt = None
-                parsed_dates.append(dt)
-            add_meta_rows_from_dates(parsed_dates)
-
-        for model_val in model_order:
-            counts_for_model = model_totals.get(model_val, {})
-            model_rows.append(
-                [model_val] + [str(counts_for_model.get(period, 0)) for period in period_order]
+            model_rows.extend(
+                [model_val] + cells
+                for model_val, cells in zip(model_order, model_matrix.astype(str).tolist())
             )
 
-        populate_model_table(headers, model_rows)
+            populate_model_table(headers, model_rows)
+            table_build_keys["model"] = build_key
+            model_invalid_date_rows.clear()
+            model_invalid_date_rows[build_key] = invalid_date_rows
 
-        refresh_model_chart_period_menu(period_order)
-        draw_model_chart()
-        status_msg = f"Model totals built ({model_period_var.get()} grouping)"
-        if invalid_date_rows and model_period_var.get() != "all":
+            refresh_model_chart_period_menu(period_order)
+            draw_model_chart()
+        status_msg = f"Model totals built ({period_kind} grouping)"
+        if invalid_date_rows and period_kind != "all":
             status_msg += f"; skipped {invalid_date_rows} invalid Start time row(s)"
         status_var.set(status_msg)
-        status_label.configure(foreground="green")
+        set_status_color("green")
 
     def build_pivot() -> None:
         if not current_headers:
@@ -3641,51 +3818,60 @@ def build_ui() -> None:
         col_field = pivot_col_field.get()
         if not row_field or not col_field:
             status_var.set("Choose row and column fields for the pivot")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             return
-        try:
-            row_idx = current_headers.index(row_field)
-            col_idx = current_headers.index(col_field)
-        except ValueError:
+        row_idx = find_header_index(row_field)
+        col_idx = find_header_index(col_field)
+        if row_idx is None or col_idx is None:
             status_var.set("Selected fields not found; reload the CSV")
-            status_label.configure(foreground="red")
+            set_status_color("red")
             return
 
-        row_order: list[str] = []
-        col_order: list[str] = []
-        counts: dict[str, dict[str, int]] = {}
-
-        def remember(value: str, collection: list[str]) -> None:
-            if value not in collection:
-                collection.append(value)
-
-        for row in current_rows:
-            row_val = row[row_idx] if row_idx < len(row) else ""
-            col_val = row[col_idx] if col_idx < len(row) else ""
-            remember(row_val, row_order)
-            remember(col_val, col_order)
-            counts.setdefault(row_val, {})
-            counts[row_val][col_val] = counts[row_val].get(col_val, 0) + 1
-
-        pivot_headers = [row_field] + col_order
-        pivot_rows: list[list[str]] = []
-        for r_val in row_order:
-            row_counts = counts.get(r_val, {})
-            pivot_rows.append(
-                [r_val] + [str(row_counts.get(c_val, 0)) for c_val in col_order]
-            )
+        build_key = (row_field, col_field, row_idx, col_idx)
+        if table_build_keys.get("pivot") != build_key:
+            # Column codes follow first appearance, so they double as the row and
+            # column order; counting is one bincount over the flattened pairs.
+            row_code_of, row_codes = filter_column_codes(row_idx)
+            col_code_of, col_codes = filter_column_codes(col_idx)
+            row_order = list(row_code_of)
+            col_order = list(col_code_of)
+            n_cols = len(col_order)
+            counts = np.bincount(
+                row_codes * n_cols + col_codes, minlength=len(row_order) * n_cols
+            ).reshape(len(row_order), n_cols)
+
+            pivot_headers = [row_field] + col_order
+            pivot_rows = [
+                [r_val] + row_counts
+                for r_val, row_counts in zip(row_order, counts.astype(str).tolist())
+            ]
 
-        populate_pivot_table(pivot_headers, pivot_rows)
+            populate_pivot_table(pivot_headers, pivot_rows)
+            table_build_keys["pivot"] = build_key
         status_var.set(
             f"Pivot built using '{row_field}' as rows and '{col_field}' as columns"
         )
-        status_label.configure(foreground="green")
+        set_status_color("green")
 
     refresh_dropdown()
     auto_load_mwo()
-    def update_window_size(_event: tk.Event) -> None:
+    pending_window_size: str | None = None
+
+    def write_window_size() -> None:
+        nonlocal pending_window_size
+        pending_window_size = None
         window_size_var.set(f"{root.winfo_width()}x{root.winfo_height()}")
 
+    def update_window_size(event: tk.Event) -> None:
+        # The root binding also sees every child widget's <Configure>, and a
+        # drag sends one per step; write the size once it has settled.
+        nonlocal pending_window_size
+        if event.widget is not root:
+            return
+        if pending_window_size is not None:
+            root.after_cancel(pending_window_size)
+        pending_window_size = root.after(50, write_window_size)
+
     def apply_saved_panel_size() -> None:
         if saved_component_sash is None:
             return
@@ -3695,7 +3881,7 @@ def build_ui() -> None:
             pass
 
     root.bind("<Configure>", update_window_size)
-    update_window_size(None)
+    write_window_size()
     apply_saved_panel_size()
     bind_double_q_close(root, root.destroy, "Press Q again to exit")
     fleet_table.bind(
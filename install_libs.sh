@@ -25,7 +25,7 @@ echo "Upgrading pip..."
 "${VENV_PY}" -m pip install --upgrade pip
 
 echo "Installing required libraries..."
-"${VENV_PY}" -m pip install matplotlib
+"${VENV_PY}" -m pip install matplotlib numpy
 
 echo "Verifying Tkinter availability (required for the GUI)..."
 if ! "${VENV_PY}" - <<'PY'